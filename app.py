@@ -1,24 +1,189 @@
 import streamlit as st
-import os
+import hashlib
+from collections import OrderedDict
 
-from src.data.azure_client import AzureDevOpsClient
-from src.analysis.sprint_analyzer import SprintAnalyzer
-from src.analysis.report_generator import ReportGenerator
+# Apenas os componentes leves de UI são importados no topo; os módulos
+# de análise (pandas, plotly etc.) são importados sob demanda dentro das
+# funções, para o servidor subir rápido mesmo antes do login
 from src.ui.components import init_session_state, render_sidebar, sprint_selector
-from src.ui.pages import (
-    render_sprint_analysis_page,
-    render_distribution_analysis_page,
-    render_dados_brutos_page,
-)
 
 # Configuração do logger
 import logging
 
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
-)
+# Guarda idempotente: em hot-reloads do Streamlit o módulo é reimportado
+# e um basicConfig incondicional arriscaria registrar handlers duplicados
+if not logging.getLogger().handlers:
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+
 logger = logging.getLogger(__name__)
 
+# Máximo de conjuntos de sprints mantidos na sessão (evicção LRU)
+MAX_DADOS_PROCESSADOS = 8
+
+
+@st.cache_resource(show_spinner=False, ttl="1h", max_entries=16)
+def _build_client(org, project, team, pat):
+    """
+    Constrói (ou reutiliza) o cliente do Azure DevOps para as credenciais.
+
+    O recurso é compartilhado entre reruns e sessões com as mesmas
+    credenciais; não deve ser mutado após a criação.
+
+    Parameters
+    ----------
+    org : str
+        Nome da organização no Azure DevOps
+    project : str
+        Nome do projeto
+    team : str
+        Nome da equipe (opcional)
+    pat : str
+        Personal Access Token para autenticação
+
+    Returns
+    -------
+    AzureDevOpsClient
+        Cliente configurado e reutilizável
+    """
+    from src.data.azure_client import AzureDevOpsClient
+
+    return AzureDevOpsClient(org, project, team, pat)
+
+
+@st.cache_resource(show_spinner=False, ttl="1h", max_entries=16)
+def _build_analyzer(org, project, team, pat):
+    """
+    Constrói (ou reutiliza) o analisador de sprints para as credenciais.
+
+    Returns
+    -------
+    SprintAnalyzer
+        Analisador vinculado ao cliente em cache
+    """
+    from src.analysis.sprint_analyzer import SprintAnalyzer
+
+    return SprintAnalyzer(_build_client(org, project, team, pat))
+
+
+@st.cache_resource(show_spinner=False, ttl="1h", max_entries=16)
+def _build_report_generator(org, project, team, pat):
+    """
+    Constrói (ou reutiliza) o gerador de relatórios para as credenciais.
+
+    Returns
+    -------
+    ReportGenerator
+        Gerador vinculado ao analisador em cache
+    """
+    from src.analysis.report_generator import ReportGenerator
+
+    return ReportGenerator(_build_analyzer(org, project, team, pat))
+
+
+@st.cache_data(ttl=600, max_entries=32, show_spinner="Conectando ao Azure DevOps...")
+def _cached_get_sprints(org, project, team, pat_hash, _pat):
+    """
+    Obtém a lista de sprints com cache de 10 minutos.
+
+    O PAT entra na chave do cache apenas como hash SHA-256 (``pat_hash``)
+    para não expor o segredo ao mecanismo de hashing do Streamlit; o
+    valor bruto (``_pat``, ignorado pelo cache) é usado só para montar
+    o cliente.
+
+    Returns
+    -------
+    tuple
+        Nomes das sprints disponíveis (imutável, barato de hashear
+        na comparação de identidade dos widgets)
+    """
+    client = _build_client(org, project, team, _pat)
+    return tuple(s["name"] for s in client.get_sprints())
+
+
+@st.cache_data(persist="disk", ttl="24h", max_entries=64, show_spinner=False)
+def _run_analysis(org, project, team, pat_hash, sprint_tuple, _pat):
+    """
+    Executa a análise de sprint(s) com cache persistido em disco.
+
+    O resultado sobrevive a reinícios do servidor: um cold start
+    reidrata os insights do filesystem em vez de refazer centenas de
+    chamadas REST.
+
+    A chave do cache é (credenciais, tupla ordenável de sprints); o PAT
+    bruto (``_pat``) é ignorado pelo hash, entrando apenas via
+    ``pat_hash``.
+
+    Parameters
+    ----------
+    sprint_tuple : tuple
+        Tupla com os nomes das sprints selecionadas
+
+    Returns
+    -------
+    tuple
+        (insights, pasta_saida, is_consolidado)
+    """
+    analyzer = _build_analyzer(org, project, team, _pat)
+
+    if len(sprint_tuple) == 1:
+        insights, pasta_saida = analyzer.analisar_sprint(sprint_tuple[0])
+        is_consolidado = False
+    else:
+        insights, pasta_saida = analyzer.analisar_multiplas_sprints(
+            list(sprint_tuple)
+        )
+        is_consolidado = True
+
+    return insights, str(pasta_saida), is_consolidado
+
+
+@st.fragment
+def _render_relatorio(dados_sessao, analyzer, report_generator):
+    """Renderiza a aba de relatório isolada em um fragmento.
+
+    Interações internas re-executam apenas o fragmento, sem repassar
+    por todo o ``main()``.
+    """
+    from src.ui.pages import render_sprint_analysis_page
+
+    render_sprint_analysis_page(
+        dados_sessao["selected_sprints"],
+        analyzer,
+        report_generator,
+        None,  # Não precisa de coluna de botões, já processamos os dados
+        dados_processados=dados_sessao,
+        mostrar_dados=False,  # Não mostrar planilha de dados nesta aba
+    )
+
+
+@st.fragment
+def _render_distribuicao(dados_sessao, analyzer):
+    """Renderiza a aba de distribuição de tasks isolada em um fragmento."""
+    from src.ui.pages import render_distribution_analysis_page
+
+    render_distribution_analysis_page(
+        dados_sessao["selected_sprints"],
+        analyzer,
+        None,  # Não precisa de coluna de input
+        None,  # Não precisa de coluna de botão
+        dados_processados=dados_sessao,
+        mostrar_dados=False,  # Não mostrar planilha de dados nesta aba
+    )
+
+
+@st.fragment
+def _render_dados_brutos(dados_sessao, analyzer):
+    """Renderiza a aba de dados brutos isolada em um fragmento."""
+    from src.ui.pages import render_dados_brutos_page
+
+    render_dados_brutos_page(
+        dados_sessao["selected_sprints"],
+        analyzer,
+        dados_processados=dados_sessao,
+    )
+
 
 def main():
     """Função principal da aplicação de análise de Sprint do Azure DevOps"""
@@ -31,148 +196,174 @@ def main():
     # Interface do usuário
     st.title("📊 Análise de Sprint")
 
-    # Renderizar sidebar e obter credenciais
-    credenciais = render_sidebar()
+    # Renderizar sidebar; as credenciais vivem no estado dos widgets
+    render_sidebar()
+    credenciais = {
+        "org": st.session_state.get("org", ""),
+        "project": st.session_state.get("project", ""),
+        "team": st.session_state.get("team", ""),
+        "pat": st.session_state.get("pat", ""),
+    }
 
     # Container principal
     with st.container():
         # Verificar credenciais
-        if not all([credenciais["org"], credenciais["project"], credenciais["pat"]]):
+        if not (credenciais["org"] and credenciais["project"] and credenciais["pat"]):
             st.warning(
                 "👈 Primeiro, insira as credenciais no menu lateral para continuar."
             )
             st.stop()
 
         try:
-            # Configura variáveis de ambiente temporárias (apenas para esta sessão)
-            os.environ["AZURE_DEVOPS_ORG"] = credenciais["org"]
-            os.environ["AZURE_DEVOPS_PROJECT"] = credenciais["project"]
-            if credenciais["team"]:
-                os.environ["AZURE_DEVOPS_TEAM"] = credenciais["team"]
-            os.environ["AZURE_DEVOPS_PAT"] = credenciais["pat"]
-
-            # Inicializa o cliente e analisador
-            client = AzureDevOpsClient(
+            # Inicializa o cliente e analisador (reutilizados entre reruns)
+            client = _build_client(
                 credenciais["org"],
                 credenciais["project"],
                 credenciais["team"],
                 credenciais["pat"],
             )
 
-            analyzer = SprintAnalyzer(client)
-            report_generator = ReportGenerator(analyzer)
+            analyzer = _build_analyzer(
+                credenciais["org"],
+                credenciais["project"],
+                credenciais["team"],
+                credenciais["pat"],
+            )
+            report_generator = _build_report_generator(
+                credenciais["org"],
+                credenciais["project"],
+                credenciais["team"],
+                credenciais["pat"],
+            )
 
-            # Obtém a lista de sprints
-            with st.spinner("Conectando ao Azure DevOps..."):
-                sprints = client.get_sprints()
-                sprint_names = [sprint["name"] for sprint in sprints]
+            # Obtém a lista de sprints (em cache por 10 minutos)
+            pat_hash = hashlib.sha256(credenciais["pat"].encode()).hexdigest()
+            sprint_names = _cached_get_sprints(
+                credenciais["org"],
+                credenciais["project"],
+                credenciais["team"],
+                pat_hash,
+                credenciais["pat"],
+            )
 
             # Seleção de sprints unificada
             selected_sprints = sprint_selector(sprint_names, key_prefix="analysis")
 
             # Inicializa a chave para armazenar dados processados na sessão
+            # (OrderedDict limitado para a sessão não crescer sem limite)
             if "dados_processados" not in st.session_state:
-                st.session_state.dados_processados = {}
+                st.session_state.dados_processados = OrderedDict()
 
-            # Chave única para identificar este conjunto de sprints
-            if len(selected_sprints) > 0:
-                sprints_key = "_".join(sorted(selected_sprints))
+            if not selected_sprints:
+                return
 
-                # Botão para processar dados
-                col1, col2 = st.columns([1, 3])
+            # Chave única para identificar este conjunto de sprints:
+            # frozenset é hasheável em O(n), sem sort nem concatenação
+            sprints_key = frozenset(selected_sprints)
+            cache = st.session_state.dados_processados
 
-                with col1:
-                    # Espaço vertical para alinhar com o select
-                    st.markdown(
-                        '<div style="padding-top: 27px;"></div>', unsafe_allow_html=True
-                    )
-                    process_button = st.button(
-                        "Processar Dados",
-                        type="primary",
-                        use_container_width=False,
-                        disabled=len(selected_sprints) == 0,
-                    )
+            # Botão para processar dados
+            col1, col2 = st.columns([1, 3])
+
+            with col1:
+                # Espaço vertical para alinhar com o select
+                st.markdown(
+                    '<div style="padding-top: 27px;"></div>', unsafe_allow_html=True
+                )
+                process_button = st.button(
+                    "Processar Dados",
+                    key="process_btn",
+                    type="primary",
+                    use_container_width=False,
+                )
+
+            with col2:
+                # Espaço vertical para alinhar com o select
+                st.markdown(
+                    '<div style="padding-top: 27px;"></div>', unsafe_allow_html=True
+                )
+                recalc_button = st.button(
+                    "Recalcular",
+                    key="recalc_btn",
+                    help="Limpa o cache de análises e reprocessa os dados",
+                )
 
-                # Processa os dados se o botão for clicado ou se já temos dados em cache
-                if process_button or (
-                    sprints_key in st.session_state.dados_processados
-                ):
-                    if process_button or not st.session_state.dados_processados.get(
-                        sprints_key
-                    ):
-                        with st.spinner(
-                            f"Processando dados de {len(selected_sprints)} sprint(s). Isso pode levar alguns minutos..."
-                        ):
-                            # Processa os dados das sprints selecionadas
-                            if len(selected_sprints) == 1:
-                                insights, pasta_saida = analyzer.analisar_sprint(
-                                    selected_sprints[0]
-                                )
-                                is_consolidado = False
-                            else:
-                                insights, pasta_saida = (
-                                    analyzer.analisar_multiplas_sprints(
-                                        selected_sprints
-                                    )
-                                )
-                                is_consolidado = True
-
-                            # Armazena os dados processados na sessão
-                            st.session_state.dados_processados[sprints_key] = {
-                                "insights": insights,
-                                "pasta_saida": str(pasta_saida),
-                                "selected_sprints": selected_sprints,
-                                "is_consolidado": is_consolidado,
-                            }
-
-                            # Limpar cache de dados unificados para forçar recálculo
-                            if "df_items_unificado" in st.session_state:
-                                del st.session_state.df_items_unificado
-
-                    # Exibe as abas de análise
-                    tabs = st.tabs(
-                        ["Relatório de Sprint", "Distribuição de Tasks", "Dados Brutos"]
+            if recalc_button:
+                # Invalidação explícita: o Streamlit descarta os resultados
+                # em cache e a análise roda de novo abaixo
+                _run_analysis.clear()
+                cache.pop(sprints_key, None)
+                process_button = True
+
+            # Sem dados processados e sem clique: orienta o usuário e sai
+            if not process_button and sprints_key not in cache:
+                st.info(
+                    "Selecione pelo menos uma sprint e clique em 'Processar Dados' para iniciar a análise."
+                )
+                return
+
+            if process_button:
+                # st.status atualiza as etapas inline, sem repintar a
+                # página inteira a cada estágio como spinners aninhados
+                with st.status(
+                    f"Processando dados de {len(selected_sprints)} sprint(s). Isso pode levar alguns minutos...",
+                    expanded=True,
+                ) as status:
+                    status.update(label="Buscando work items no Azure DevOps...")
+
+                    # Processa os dados das sprints selecionadas
+                    # (resultado em cache compartilhado entre sessões)
+                    insights, pasta_saida, is_consolidado = _run_analysis(
+                        credenciais["org"],
+                        credenciais["project"],
+                        credenciais["team"],
+                        pat_hash,
+                        tuple(sorted(selected_sprints)),
+                        credenciais["pat"],
                     )
-                    tab_relatorio, tab_distribuicao, tab_dados_brutos = tabs
-
-                    # Dados da sessão
-                    dados_sessao = st.session_state.dados_processados[sprints_key]
-
-                    # Aba de relatório de sprint
-                    with tab_relatorio:
-                        render_sprint_analysis_page(
-                            dados_sessao["selected_sprints"],
-                            analyzer,
-                            report_generator,
-                            None,  # Não precisa de coluna de botões, já processamos os dados
-                            dados_processados=dados_sessao,
-                            mostrar_dados=False,  # Não mostrar planilha de dados nesta aba
-                        )
-
-                    # Aba de distribuição de tasks
-                    with tab_distribuicao:
-                        # Para análise de distribuição com múltiplas sprints
-                        render_distribution_analysis_page(
-                            dados_sessao["selected_sprints"],
-                            analyzer,
-                            None,  # Não precisa de coluna de input
-                            None,  # Não precisa de coluna de botão
-                            dados_processados=dados_sessao,
-                            mostrar_dados=False,  # Não mostrar planilha de dados nesta aba
-                        )
-
-                    # Aba de dados brutos
-                    with tab_dados_brutos:
-                        render_dados_brutos_page(
-                            dados_sessao["selected_sprints"],
-                            analyzer,
-                            dados_processados=dados_sessao,
-                        )
-                else:
-                    st.info(
-                        "Selecione pelo menos uma sprint e clique em 'Processar Dados' para iniciar a análise."
+
+                    # Guarda apenas as referências na sessão, descartando a
+                    # entrada menos recente quando o limite é atingido
+                    if sprints_key not in cache and len(cache) >= MAX_DADOS_PROCESSADOS:
+                        cache.popitem(last=False)
+
+                    cache[sprints_key] = {
+                        "insights": insights,
+                        "pasta_saida": pasta_saida,
+                        "selected_sprints": selected_sprints,
+                        "is_consolidado": is_consolidado,
+                    }
+                    cache.move_to_end(sprints_key)
+
+                    status.update(
+                        label="Análise concluída!",
+                        state="complete",
+                        expanded=False,
                     )
 
+            # Exibe as abas de análise
+            tabs = st.tabs(
+                ["Relatório de Sprint", "Distribuição de Tasks", "Dados Brutos"]
+            )
+            tab_relatorio, tab_distribuicao, tab_dados_brutos = tabs
+
+            # Dados da sessão (marca a entrada como usada recentemente)
+            dados_sessao = cache[sprints_key]
+            cache.move_to_end(sprints_key)
+
+            # Aba de relatório de sprint
+            with tab_relatorio:
+                _render_relatorio(dados_sessao, analyzer, report_generator)
+
+            # Aba de distribuição de tasks
+            with tab_distribuicao:
+                # Para análise de distribuição com múltiplas sprints
+                _render_distribuicao(dados_sessao, analyzer)
+
+            # Aba de dados brutos
+            with tab_dados_brutos:
+                _render_dados_brutos(dados_sessao, analyzer)
+
         except Exception as e:
             st.error(f"Erro ao conectar ou processar dados: {str(e)}")
             st.write("⚠️ Verifique suas credenciais e tente novamente.")
@@ -1,154 +1,165 @@
+import hashlib
 import json
+import re
+from collections import Counter
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
 import os
 import logging
 from pathlib import Path
 from datetime import datetime
-import plotly.express as px
-import plotly.graph_objects as go
-import pandas as pd
+from string import Template
+import plotly.io as pio
+
+# plotly.graph_objects e pandas são pesados de importar (~1 s); ficam
+# como imports locais nos métodos de gráfico para o módulo carregar
+# rápido quando só o caminho de montagem de HTML é exercitado
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Serialização de figuras em C via orjson quando disponível; em versões
+# recentes do plotly o engine é selecionado automaticamente
+if orjson is not None:
+    try:
+        pio.json.config.default_engine = "orjson"
+    except (AttributeError, ValueError):
+        pass
+
+
+def _carregar_json(caminho):
+    """
+    Carrega um arquivo JSON em uma única leitura de bytes.
+
+    ``Path.read_bytes`` faz uma leitura direta, sem decodificação de
+    texto em buffer, e o orjson (quando instalado) desserializa em C —
+    bem mais rápido que o json da stdlib para os arquivos grandes de
+    dados processados.
+
+    Parameters
+    ----------
+    caminho : Path
+        Caminho do arquivo JSON
+
+    Returns
+    -------
+    dict or list
+        Conteúdo desserializado do arquivo
+    """
+    dados = Path(caminho).read_bytes()
+    if orjson is not None:
+        return orjson.loads(dados)
+    return json.loads(dados)
 
 logger = logging.getLogger(__name__)
 
-
-class ReportGenerator:
-    """Classe para geração de relatórios e visualizações dos dados de sprint."""
-
-    def __init__(self, sprint_analyzer):
-        """
-        Inicializa o gerador de relatórios.
-
-        Parameters
-        ----------
-        sprint_analyzer : SprintAnalyzer
-            Analisador de sprint para acesso a dados e configurações
-        """
-        self.sprint_analyzer = sprint_analyzer
-
-    def gerar_graficos_plotly(self, dados_processados, nome_sprint):
-        """
-        Gera gráficos interativos Plotly para os dados da sprint.
-
-        Parameters
-        ----------
-        dados_processados : list
-            Lista de itens processados
-        nome_sprint : str
-            Nome da sprint
-
-        Returns
-        -------
-        dict
-            Dicionário com objetos de figura do Plotly
-        """
-        logger.info(f"Gerando gráficos interativos para sprint: {nome_sprint}")
-
-        graficos = {}
-
-        # Implementação dos gráficos interativos
-        # Esta função será implementada posteriormente
-
-        return graficos
-
-    def gerar_relatorio_executivo(self, nome_sprint, pasta_saida):
-        """
-        Gera relatório executivo HTML com insights e visualizações.
-
-        Parameters
-        ----------
-        nome_sprint : str
-            Nome da sprint
-        pasta_saida : Path
-            Caminho com dados e visualizações
-
-        Returns
-        -------
-        str
-            Caminho para o relatório HTML gerado
-        """
-        logger.info(f"Gerando relatório executivo para sprint: {nome_sprint}")
-
-        arquivo_saida = pasta_saida / "relatorio_executivo.html"
-
-        # Verifica se temos os dados necessários
-        if not (pasta_saida / "insights.json").exists():
-            logger.error(f"Arquivo de insights não encontrado em {pasta_saida}")
-            return None
-
-        # Carrega os insights
-        with open(pasta_saida / "insights.json", "r") as f:
-            insights = json.load(f)
-
-        # Carrega dados processados para gerar gráficos Plotly
-        dados_processados_path = pasta_saida / "dados_processados.json"
-        if dados_processados_path.exists():
-            with open(dados_processados_path, "r") as f:
-                dados_processados = json.load(f)
-            # Gera gráficos Plotly
-            graficos_plotly = self.gerar_graficos_plotly(dados_processados, nome_sprint)
-        else:
-            logger.error(
-                f"Arquivo de dados processados não encontrado: {dados_processados_path}"
-            )
-            graficos_plotly = {}
-
-        # Gera HTML com os gráficos Plotly
-        html_content = self._gerar_html_com_plotly(
-            nome_sprint, insights, graficos_plotly
-        )
-
-        # Salva o relatório
-        with open(arquivo_saida, "w", encoding="utf-8") as f:
-            f.write(html_content)
-
-        logger.info(f"Relatório executivo gerado: {arquivo_saida}")
-
-        return str(arquivo_saida)
-
-    def _gerar_html_com_plotly(self, nome_sprint, insights, graficos_plotly):
-        """
-        Gera HTML com gráficos Plotly embutidos.
-
-        Parameters
-        ----------
-        nome_sprint : str
-            Nome da sprint
-        insights : dict
-            Insights da análise
-        graficos_plotly : dict
-            Dicionário com objetos de figura do Plotly
-
-        Returns
-        -------
-        str
-            HTML gerado
-        """
-        # Gera os gráficos como HTML
-        graficos_html = {}
-
-        # Só inclui o Plotly.js uma vez
-        include_plotlyjs = "cdn"
-
-        for nome, fig in graficos_plotly.items():
-            try:
-                graficos_html[nome] = fig.to_html(
-                    include_plotlyjs=include_plotlyjs,
-                    full_html=False,
-                    config={"responsive": True},
-                )
-                # Depois do primeiro gráfico, não precisamos incluir o plotly.js novamente
-                include_plotlyjs = False
-            except Exception as e:
-                logger.error(f"Erro ao converter gráfico Plotly para HTML: {str(e)}")
-                graficos_html[nome] = f"<div>Erro ao gerar gráfico: {nome}</div>"
-
-        html = f"""
+# Paleta qualitativa padrão do Plotly Express, pré-alocada para os
+# gráficos de barra construídos direto com go.Bar
+_PALETA = (
+    "#636EFA",
+    "#EF553B",
+    "#00CC96",
+    "#AB63FA",
+    "#FFA15A",
+    "#19D3F3",
+    "#FF6692",
+    "#B6E880",
+    "#FF97FF",
+    "#FECB52",
+)
+
+
+def _cores_categorias(quantidade):
+    """Retorna uma cor da paleta por categoria, ciclando se necessário."""
+    return [_PALETA[i % len(_PALETA)] for i in range(quantidade)]
+
+
+# Fallback exibido quando um gráfico não pôde ser gerado
+_GRAFICO_INDISPONIVEL = "<div>Gráfico não disponível</div>"
+
+# Bundle plotly.min.js embutido, carregado uma única vez por processo
+_SCRIPT_PLOTLY_INLINE = None
+
+
+def _script_plotly_inline():
+    """
+    Retorna o bundle plotly.min.js embutido em uma tag <script>.
+
+    O HTML gerado precisa ser autocontido: o app o exibe em um iframe
+    (st.components.v1.html) e o entrega via st.download_button como
+    arquivo avulso — em ambos os casos uma URL relativa para o bundle
+    não resolveria. O texto do bundle é lido uma única vez por
+    processo e reaproveitado em todos os relatórios.
+
+    Returns
+    -------
+    str
+        Tag <script> com o bundle completo
+    """
+    global _SCRIPT_PLOTLY_INLINE
+    if _SCRIPT_PLOTLY_INLINE is None:
+        from plotly.offline import get_plotlyjs
+
+        _SCRIPT_PLOTLY_INLINE = f"<script>{get_plotlyjs()}</script>"
+    return _SCRIPT_PLOTLY_INLINE
+
+
+_RE_COMENTARIO_CSS = re.compile(r"/\*.*?\*/", re.S)
+_RE_ESPACOS = re.compile(r"\s+")
+_RE_BLOCO_STYLE = re.compile(r"<style>(.*?)</style>", re.S)
+
+
+def _minificar_css(texto):
+    """
+    Minifica os blocos <style> de um template HTML.
+
+    Roda uma única vez no import do módulo; cada relatório emitido fica
+    alguns KB menor sem custo por render.
+
+    Parameters
+    ----------
+    texto : str
+        Fonte do template HTML
+
+    Returns
+    -------
+    str
+        Template com o CSS compactado
+    """
+
+    def _compactar(m):
+        css = _RE_COMENTARIO_CSS.sub("", m.group(1))
+        css = _RE_ESPACOS.sub(" ", css)
+        for par in ("; ", " {", "{ ", " }", "} ", ": ", ", "):
+            css = css.replace(par, par.strip())
+        return "<style>" + css.strip() + "</style>"
+
+    return _RE_BLOCO_STYLE.sub(_compactar, texto)
+
+
+# Templates HTML dos relatórios, analisados uma única vez no import do
+# módulo. string.Template dispensa o escape de chaves (o CSS/JS usa
+# "{}" livremente) e a substituição de $placeholders é uma passada
+# única sobre o texto, em vez de reconstruir o f-string a cada chamada.
+_TEMPLATE_SECAO_RETORNOS = Template(
+    "<h3>Análise de Retornos</h3><p>$retornos_unicos itens experimentaram "
+    "$retornos transições de retorno. Isso pode indicar problemas com o "
+    "processo de desenvolvimento ou controle de qualidade.</p>"
+    '<div class="image-container">$grafico_retornos</div>'
+)
+
+_TEMPLATE_RELATORIO_EXECUTIVO = Template(
+    _minificar_css("""
         <!DOCTYPE html>
         <html>
         <head>
-            <title>Relatório de Análise de Sprint - {nome_sprint}</title>
+            <title>Relatório de Análise de Sprint - $nome_sprint</title>
+            $script_plotly
             <meta charset="UTF-8">
             <style>
-                body {{
+                body {
                     font-family: 'Segoe UI', Arial, sans-serif;
                     line-height: 1.6;
                     color: #333;
@@ -156,159 +167,159 @@ class ReportGenerator:
                     margin: 0 auto;
                     padding: 20px;
                     background-color: #f8f9fa;
-                }}
-                h1, h2, h3 {{
+                }
+                h1, h2, h3 {
                     color: #0078d4;
                     font-weight: 500;
-                }}
-                .dashboard {{
+                }
+                .dashboard {
                     display: grid;
                     grid-template-columns: repeat(4, 1fr);
                     gap: 16px;
                     margin-bottom: 30px;
-                }}
-                .card {{
+                }
+                .card {
                     background: white;
                     border-radius: 10px;
                     padding: 20px;
                     box-shadow: 0 2px 10px rgba(0,0,0,0.05);
                     transition: transform 0.2s, box-shadow 0.2s;
-                }}
-                .card:hover {{
+                }
+                .card:hover {
                     transform: translateY(-3px);
                     box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-                }}
-                .metric {{
+                }
+                .metric {
                     font-size: 28px;
                     font-weight: 600;
                     color: #0078d4;
                     margin-bottom: 8px;
-                }}
-                .metric-label {{
+                }
+                .metric-label {
                     font-size: 14px;
                     color: #666;
                     font-weight: 500;
-                }}
-                .section-card {{
+                }
+                .section-card {
                     background: white;
                     border-radius: 10px;
                     padding: 24px;
                     box-shadow: 0 2px 10px rgba(0,0,0,0.05);
                     margin-bottom: 24px;
-                }}
-                .section-title {{
+                }
+                .section-title {
                     font-size: 18px;
                     font-weight: 600;
                     color: #0078d4;
                     margin-bottom: 16px;
                     padding-bottom: 8px;
                     border-bottom: 2px solid #f0f0f0;
-                }}
-                table {{
+                }
+                table {
                     width: 100%;
                     border-collapse: collapse;
                     margin: 20px 0;
                     border-radius: 8px;
                     overflow: hidden;
-                }}
-                th, td {{
+                }
+                th, td {
                     padding: 12px 16px;
                     text-align: left;
-                }}
-                th {{
+                }
+                th {
                     background-color: #f2f7fd;
                     color: #0078d4;
                     font-weight: 500;
-                }}
-                tr:nth-child(even) {{
+                }
+                tr:nth-child(even) {
                     background-color: #f9f9f9;
-                }}
-                tr:hover {{
+                }
+                tr:hover {
                     background-color: #f2f7fd;
-                }}
-                .warning {{
+                }
+                .warning {
                     color: #e74c3c;
-                }}
-                .success {{
+                }
+                .success {
                     color: #27ae60;
-                }}
-                .image-container {{
+                }
+                .image-container {
                     margin: 20px 0;
                     max-width: 100%;
                     border-radius: 8px;
                     overflow: hidden;
                     box-shadow: 0 2px 10px rgba(0,0,0,0.05);
-                }}
-                .progress-container {{
+                }
+                .progress-container {
                     width: 100%;
                     background-color: #f1f1f1;
                     border-radius: 20px;
                     margin: 10px 0;
                     overflow: hidden;
-                }}
-                .progress-bar {{
+                }
+                .progress-bar {
                     height: 12px;
                     border-radius: 20px;
                     background: linear-gradient(90deg, #0078d4, #00b7c3);
-                }}
-                .stats-container {{
+                }
+                .stats-container {
                     display: flex;
                     justify-content: space-between;
                     margin-bottom: 10px;
-                }}
-                .stat {{
+                }
+                .stat {
                     font-weight: 500;
-                }}
-                .two-columns {{
+                }
+                .two-columns {
                     display: grid;
                     grid-template-columns: repeat(2, 1fr);
                     gap: 24px;
-                }}
-                @media print {{
-                    .card, .section-card {{
+                }
+                @media print {
+                    .card, .section-card {
                         break-inside: avoid;
                         box-shadow: none;
                         border: 1px solid #eee;
-                    }}
-                    .image-container {{
+                    }
+                    .image-container {
                         break-inside: avoid;
                         page-break-inside: avoid;
                         box-shadow: none;
-                    }}
-                }}
-                @media (max-width: 768px) {{
-                    .dashboard {{
+                    }
+                }
+                @media (max-width: 768px) {
+                    .dashboard {
                         grid-template-columns: repeat(2, 1fr);
-                    }}
-                    .two-columns {{
+                    }
+                    .two-columns {
                         grid-template-columns: 1fr;
-                    }}
-                }}
+                    }
+                }
             </style>
         </head>
         <body>
             <h1>Relatório de Análise de Sprint</h1>
-            <h2>{nome_sprint}</h2>
+            <h2>$nome_sprint</h2>
             
             <div class="dashboard">
                 <div class="card">
-                    <div class="metric">{insights["total_itens"]}</div>
+                    <div class="metric">$total_itens</div>
                     <div class="metric-label">Total de Itens de Trabalho</div>
                 </div>
                 <div class="card">
-                    <div class="metric">{insights["esforco_total"]}</div>
+                    <div class="metric">$esforco_total</div>
                     <div class="metric-label">Pontos de Esforço Total</div>
                 </div>
                 <div class="card">
-                    <div class="metric">{insights["percentual_concluido"]:.1f}%</div>
+                    <div class="metric">$percentual_concluido%</div>
                     <div class="metric-label">Taxa de Conclusão (Tasks)</div>
                 </div>
                 <div class="card">
-                    <div class="metric">{insights.get("percentual_esforco_concluido", 0):.1f}%</div>
+                    <div class="metric">$percentual_esforco_concluido%</div>
                     <div class="metric-label">Taxa de Conclusão (Esforço)</div>
                 </div>
                 <div class="card">
-                    <div class="metric">{insights["adicoes_meio_sprint"]}</div>
+                    <div class="metric">$adicoes_meio_sprint</div>
                     <div class="metric-label">Itens Adicionados no Meio da Sprint</div>
                 </div>
             </div>
@@ -317,61 +328,61 @@ class ReportGenerator:
             <h3>Análise de Chamados</h3>
             <div class="card">
                 <div class="stats-container">
-                    <div class="stat">Total de Chamados: {insights.get("total_chamados", 0)}</div>
-                    <div class="stat">Chamados Concluídos: {insights.get("chamados_concluidos", 0)}</div>
-                    <div class="stat">Percentual: {insights.get("percentual_chamados_concluidos", 0):.1f}%</div>
+                    <div class="stat">Total de Chamados: $total_chamados</div>
+                    <div class="stat">Chamados Concluídos: $chamados_concluidos</div>
+                    <div class="stat">Percentual: $percentual_chamados%</div>
                 </div>
                 <div class="progress-container">
-                    <div class="progress-bar" style="width: {insights.get("percentual_chamados_concluidos", 0)}%"></div>
+                    <div class="progress-bar" style="width: $percentual_chamados%"></div>
                 </div>
-                <p>Esta sprint continha <strong>{insights.get("total_chamados", 0)}</strong> chamados, dos quais <strong>{insights.get("chamados_concluidos", 0)}</strong> foram concluídos,
-                representando uma taxa de conclusão de <strong>{insights.get("percentual_chamados_concluidos", 0):.1f}%</strong>.</p>
+                <p>Esta sprint continha <strong>$total_chamados</strong> chamados, dos quais <strong>$chamados_concluidos</strong> foram concluídos,
+                representando uma taxa de conclusão de <strong>$percentual_chamados%</strong>.</p>
             </div>
             
             <h3>Resumo da Sprint</h3>
             <p>
-                Esta sprint continha {insights["total_itens"]} itens de trabalho com um esforço total de 
-                {insights["esforco_total"]} pontos. {insights["percentual_concluido"]:.1f}% dos itens 
+                Esta sprint continha $total_itens itens de trabalho com um esforço total de 
+                $esforco_total pontos. $percentual_concluido% dos itens 
                 foram concluídos até o final da sprint.
             </p>
             <p>
-                {insights["adicoes_meio_sprint"]} itens foram adicionados após o início da sprint, 
-                representando {(insights["adicoes_meio_sprint"] / insights["total_itens"] * 100 if insights["total_itens"] > 0 else 0):.1f}% do trabalho total.
+                $adicoes_meio_sprint itens foram adicionados após o início da sprint, 
+                representando $percentual_adicoes% do trabalho total.
             </p>
             <p>
-                Houve {insights["retornos_unicos"]} itens que experimentaram retornos 
-                (movendo-se para trás no fluxo de trabalho), com um total de {insights["retornos"]} transições de retorno.
+                Houve $retornos_unicos itens que experimentaram retornos 
+                (movendo-se para trás no fluxo de trabalho), com um total de $retornos transições de retorno.
             </p>
             
             <h3>Itens de Trabalho por Tipo</h3>
             <div class="image-container">
-                {graficos_html.get('itens_por_tipo', '<div>Gráfico não disponível</div>')}
+                $grafico_itens_por_tipo
             </div>
             
             <h3>Distribuição de Estado Atual</h3>
             <div class="image-container">
-                {graficos_html.get('itens_por_estado', '<div>Gráfico não disponível</div>')}
+                $grafico_itens_por_estado
             </div>
             
             <h3>Carga de Trabalho da Equipe</h3>
             <div class="image-container">
-                {graficos_html.get('itens_por_responsavel', '<div>Gráfico não disponível</div>')}
+                $grafico_itens_por_responsavel
             </div>
             <div class="image-container">
-                {graficos_html.get('esforco_por_responsavel', '<div>Gráfico não disponível</div>')}
+                $grafico_esforco_por_responsavel
             </div>
             
             <h3>Eficiência do Processo</h3>
             <div class="image-container">
-                {graficos_html.get('tempo_medio_coluna', '<div>Gráfico não disponível</div>')}
+                $grafico_tempo_medio_coluna
             </div>
             
             <h3>Adições no Meio da Sprint</h3>
             <div class="image-container">
-                {graficos_html.get('adicoes_meio_sprint', '<div>Gráfico não disponível</div>')}
+                $grafico_adicoes_meio_sprint
             </div>
             
-            {'<h3>Análise de Retornos</h3><p>' + str(insights["retornos_unicos"]) + ' itens experimentaram ' + str(insights["retornos"]) + ' transições de retorno. Isso pode indicar problemas com o processo de desenvolvimento ou controle de qualidade.</p><div class="image-container">' + graficos_html.get('retornos', '<div>Gráfico não disponível</div>') + '</div>' if 'retornos' in graficos_html else ''}
+            $retornos_section
             
             <h3>Recomendações</h3>
             <ul>
@@ -382,96 +393,14 @@ class ReportGenerator:
                 <li>Revisar adições no meio da sprint para melhorar o planejamento da sprint</li>
             </ul>
             
-            <p><em>Relatório gerado em {datetime.now().strftime("%d/%m/%Y %H:%M:%S")} pelo time de Payments 💙 | Sistema Boletinho Analytics</em></p>
+            <p><em>Relatório gerado em $gerado_em pelo time de Payments 💙 | Sistema Boletinho Analytics</em></p>
         </body>
         </html>
-        """
-
-        return html
-
-    def gerar_relatorio_consolidado(self, nomes_sprints, pasta_saida):
-        """
-        Gera relatório consolidado para múltiplas sprints.
-
-        Parameters
-        ----------
-        nomes_sprints : list
-            Lista de nomes das sprints
-        pasta_saida : Path
-            Caminho para a pasta de saída
-
-        Returns
-        -------
-        str
-            Caminho para o relatório gerado
-        """
-        logger.info(f"Gerando relatório consolidado para {len(nomes_sprints)} sprints")
-
-        arquivo_saida = pasta_saida / "relatorio_consolidado.html"
-
-        # Carrega os insights consolidados
-        with open(pasta_saida / "insights_consolidados.json", "r") as f:
-            insights_consolidados = json.load(f)
-
-        # Gera gráficos de tendência com Plotly diretamente a partir dos insights consolidados
-        graficos_tendencia = self._gerar_graficos_tendencia_plotly(
-            insights_consolidados
-        )
-
-        # Gera o HTML com o conteúdo estático para as sprints individuais
-        # Em vez de tentar carregar dados processados que não encontramos
-        html_content = self._gerar_html_consolidado_simplificado(
-            nomes_sprints, insights_consolidados, graficos_tendencia
-        )
-
-        # Salva o relatório
-        with open(arquivo_saida, "w", encoding="utf-8") as f:
-            f.write(html_content)
-
-        logger.info(f"Relatório consolidado gerado: {arquivo_saida}")
-
-        return str(arquivo_saida)
-
-    def _gerar_html_consolidado_simplificado(
-        self, nomes_sprints, insights_consolidados, graficos_tendencia
-    ):
-        """
-        Gera HTML consolidado com gráficos Plotly para tendências e tabelas para detalhes.
-
-        Parameters
-        ----------
-        nomes_sprints : list
-            Lista de nomes das sprints
-        insights_consolidados : dict
-            Insights consolidados
-        graficos_tendencia : dict
-            Gráficos de tendência Plotly
-
-        Returns
-        -------
-        str
-            HTML gerado
-        """
-        # Converte os gráficos de tendência para HTML
-        include_plotlyjs = "cdn"
-
-        graficos_tendencia_html = {}
-        for nome, fig in graficos_tendencia.items():
-            graficos_tendencia_html[nome] = fig.to_html(
-                include_plotlyjs=include_plotlyjs,
-                full_html=False,
-                config={"responsive": True},
-            )
-            include_plotlyjs = False  # Depois do primeiro gráfico, não precisamos incluir o plotly.js novamente
-
-        # Gera HTML para tabelas de sprint em vez de gráficos interativos
-        sprint_sections_html = ""
-        for sprint in nomes_sprints:
-            if sprint in insights_consolidados["por_sprint"]:
-                sprint_data = insights_consolidados["por_sprint"][sprint]
+    """)
+)
 
-                # Cria tabela de dados para esta sprint
-                sprint_table = f"""
+_TEMPLATE_TABELA_SPRINT = Template(
+    """
                 <table class="sprint-details-table">
                     <tr>
                         <th>Métrica</th>
@@ -479,177 +408,321 @@ class ReportGenerator:
                     </tr>
                     <tr>
                         <td>Total de Itens</td>
-                        <td>{sprint_data.get('total_itens', 'N/A')}</td>
+                        <td>$total_itens</td>
                     </tr>
                     <tr>
                         <td>Esforço Total</td>
-                        <td>{sprint_data.get('esforco_total', 'N/A')}</td>
+                        <td>$esforco_total</td>
                     </tr>
                     <tr>
                         <td>Taxa de Conclusão</td>
-                        <td>{sprint_data.get('percentual_concluido', 'N/A'):.1f}%</td>
+                        <td>$percentual_concluido%</td>
                     </tr>
                     <tr>
                         <td>Adições no Meio da Sprint</td>
-                        <td>{sprint_data.get('adicoes_meio_sprint', 'N/A')}</td>
+                        <td>$adicoes_meio_sprint</td>
                     </tr>
                     <tr>
                         <td>Retornos</td>
-                        <td>{sprint_data.get('retornos', 'N/A')}</td>
+                        <td>$retornos</td>
                     </tr>
                     <tr>
                         <td>Chamados</td>
-                        <td>{sprint_data.get('total_chamados', 'N/A')}</td>
+                        <td>$total_chamados</td>
                     </tr>
                     <tr>
                         <td>Chamados Concluídos</td>
-                        <td>{sprint_data.get('chamados_concluidos', 'N/A')}</td>
+                        <td>$chamados_concluidos</td>
                     </tr>
                 </table>
-                """
+    """
+)
 
-                sprint_section = f"""
-                <button class="collapsible">{sprint}</button>
+_TEMPLATE_SECAO_SPRINT = Template(
+    """
+                <button class="collapsible">$sprint</button>
                 <div class="content">
                     <div class="sprint-section">
-                        <div class="sprint-title">{sprint}</div>
+                        <div class="sprint-title">$sprint</div>
                         <h4>Detalhes da Sprint</h4>
-                        {sprint_table}
+                        $tabela
                         <p>Para visualizar gráficos detalhados, acesse o relatório individual desta sprint.</p>
                     </div>
                 </div>
-                """
-                sprint_sections_html += sprint_section
+    """
+)
 
-        # Gera o HTML completo
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Relatório Consolidado de Sprints</title>
-            <meta charset="UTF-8">
-            <style>
-                body {{
-                    font-family: Arial, sans-serif;
-                    line-height: 1.6;
-                    color: #333;
-                    max-width: 1200px;
-                    margin: 0 auto;
-                    padding: 20px;
-                }}
-                
-                h1, h2, h3, h4 {{
-                    color: #0078d4;
-                }}
-                
-                .dashboard {{
-                    display: grid;
-                    grid-template-columns: repeat(2, 1fr);
-                    gap: 20px;
-                    margin-bottom: 30px;
-                }}
-                
-                .card {{
-                    background: #f9f9f9;
-                    border-radius: 8px;
-                    padding: 20px;
-                    box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
-                }}
-                
-                .metric {{
-                    font-size: 24px;
-                    font-weight: bold;
-                    color: #0078d4;
-                    margin-bottom: 8px;
-                }}
-                
-                .metric-label {{
-                    font-size: 14px;
-                    color: #666;
-                }}
-                
-                table {{
-                    width: 100%;
-                    border-collapse: collapse;
-                    margin: 20px 0;
-                }}
-                
-                th, td {{
-                    padding: 12px;
-                    text-align: left;
-                    border-bottom: 1px solid #ddd;
-                }}
-                
-                th {{
-                    background-color: #f2f2f2;
-                }}
-                
-                .warning {{
-                    color: #e74c3c;
-                }}
-                
-                .success {{
-                    color: #27ae60;
-                }}
-                
-                .image-container {{
-                    margin: 20px 0;
-                }}
-                
-                .progress-container {{
-                    width: 100%;
-                    background-color: #f1f1f1;
-                    border-radius: 4px;
-                    margin: 10px 0;
-                }}
-                
-                .progress-bar {{
-                    height: 20px;
-                    border-radius: 4px;
-                    background-color: #4CAF50;
-                }}
-                
-                .stats-container {{
-                    display: flex;
-                    justify-content: space-between;
-                    margin-bottom: 10px;
-                }}
-                
-                .stat {{
-                    font-weight: bold;
-                }}
+_TEMPLATE_SECAO_SPRINT_COMPLETA = Template("""
+            <button class="collapsible">$sprint</button>
+            <div class="content">
+                <div class="sprint-section">
+                    <div class="sprint-title">$sprint</div>
+
+                    <h4>Itens de Trabalho por Tipo</h4>
+                    <div class="image-container">
+                        $itens_por_tipo
+                    </div>
+
+                    <h4>Distribuição de Estado Atual</h4>
+                    <div class="image-container">
+                        $itens_por_estado
+                    </div>
+
+                    <div class="sprint-grid">
+                        <div>
+                            <h4>Carga de Trabalho por Responsável</h4>
+                            <div class="image-container">
+                                $itens_por_responsavel
+                            </div>
+                        </div>
+                        <div>
+                            <h4>Esforço por Responsável</h4>
+                            <div class="image-container">
+                                $esforco_por_responsavel
+                            </div>
+                        </div>
+                    </div>
+
+                    <h4>Tempo Médio em Coluna</h4>
+                    <div class="image-container">
+                        $tempo_medio_coluna
+                    </div>
+
+                    <div class="sprint-grid">
+                        <div>
+                            <h4>Adições no Meio da Sprint</h4>
+                            <div class="image-container">
+                                $adicoes_meio_sprint
+                            </div>
+                        </div>
+                        <div>
+                            <h4>Retornos</h4>
+                            <div class="image-container">
+                                $retornos
+                            </div>
+                        </div>
+                    </div>
+                </div>
+            </div>
+""")
+
+# CSS estático dos cards de métricas, minificado uma única vez no
+# import; só os valores dinâmicos são substituídos a cada render
+_CARDS_CSS = _minificar_css("""
+        <style>
+            .card-container {
+                display: flex;
+                flex-wrap: wrap;
+                gap: 15px;
+                justify-content: space-between;
+                margin-bottom: 20px;
+            }
+            .card {
+                background-color: #f9f9f9;
+                border-radius: 8px;
+                padding: 20px;
+                box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+                flex: 1;
+                min-width: 200px;
+            }
+            .metric {
+                font-size: 28px;
+                font-weight: bold;
+                color: #0078d4;
+                margin-bottom: 8px;
+            }
+            .metric-label {
+                font-size: 14px;
+                color: #666;
+            }
+            .progress-container {
+                width: 100%;
+                height: 8px;
+                background-color: #f1f1f1;
+                border-radius: 4px;
+                margin-top: 10px;
+                overflow: hidden;
+            }
+            .progress-bar {
+                height: 100%;
+                background-color: #4CAF50;
+                border-radius: 4px;
+            }
+        </style>
+""").strip()
+
+_TEMPLATE_CARDS_METRICAS = Template("""
+        <div class="card-container">
+            <div class="card">
+                <div class="metric">$total_itens</div>
+                <div class="metric-label">Total de Itens de Trabalho</div>
+            </div>
+            <div class="card">
+                <div class="metric">$esforco_total</div>
+                <div class="metric-label">Pontos de Esforço Total</div>
+            </div>
+            <div class="card">
+                <div class="metric">$percentual_concluido%</div>
+                <div class="metric-label">Taxa de Conclusão</div>
+                <div class="progress-container">
+                    <div class="progress-bar" style="width: $percentual_concluido%;"></div>
+                </div>
+            </div>
+            <div class="card">
+                <div class="metric">$adicoes_meio_sprint</div>
+                <div class="metric-label">Itens Adicionados no Meio da Sprint</div>
+            </div>
+        </div>
+""")
+
+_TEMPLATE_CARD_CHAMADOS = Template("""
+            <div class="card-container">
+                <div class="card" style="width: 100%;">
+                    <div style="display: flex; justify-content: space-between; align-items: center;">
+                        <div style="font-weight: bold; font-size: 16px;">Análise de Chamados</div>
+                        <div style="display: flex; gap: 20px;">
+                            <span>Total: $total_chamados</span>
+                            <span>Concluídos: $chamados_concluidos</span>
+                            <span>Taxa: $percentual_chamados%</span>
+                        </div>
+                    </div>
+                    <div class="progress-container" style="margin-top: 15px;">
+                        <div class="progress-bar" style="width: $percentual_chamados%;"></div>
+                    </div>
+                </div>
+            </div>
+""")
+
+_TEMPLATE_RELATORIO_CONSOLIDADO = Template(
+    _minificar_css("""
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>Relatório Consolidado de Sprints</title>
+            <meta charset="UTF-8">
+            $script_plotly
+            <style>
+                body {
+                    font-family: Arial, sans-serif;
+                    line-height: 1.6;
+                    color: #333;
+                    max-width: 1200px;
+                    margin: 0 auto;
+                    padding: 20px;
+                }
+                
+                h1, h2, h3, h4 {
+                    color: #0078d4;
+                }
+                
+                .dashboard {
+                    display: grid;
+                    grid-template-columns: repeat(2, 1fr);
+                    gap: 20px;
+                    margin-bottom: 30px;
+                }
+                
+                .card {
+                    background: #f9f9f9;
+                    border-radius: 8px;
+                    padding: 20px;
+                    box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
+                }
+                
+                .metric {
+                    font-size: 24px;
+                    font-weight: bold;
+                    color: #0078d4;
+                    margin-bottom: 8px;
+                }
+                
+                .metric-label {
+                    font-size: 14px;
+                    color: #666;
+                }
+                
+                table {
+                    width: 100%;
+                    border-collapse: collapse;
+                    margin: 20px 0;
+                }
+                
+                th, td {
+                    padding: 12px;
+                    text-align: left;
+                    border-bottom: 1px solid #ddd;
+                }
+                
+                th {
+                    background-color: #f2f2f2;
+                }
+                
+                .warning {
+                    color: #e74c3c;
+                }
+                
+                .success {
+                    color: #27ae60;
+                }
+                
+                .image-container {
+                    margin: 20px 0;
+                }
+                
+                .progress-container {
+                    width: 100%;
+                    background-color: #f1f1f1;
+                    border-radius: 4px;
+                    margin: 10px 0;
+                }
+                
+                .progress-bar {
+                    height: 20px;
+                    border-radius: 4px;
+                    background-color: #4CAF50;
+                }
+                
+                .stats-container {
+                    display: flex;
+                    justify-content: space-between;
+                    margin-bottom: 10px;
+                }
+                
+                .stat {
+                    font-weight: bold;
+                }
                 
-                .sprint-section {{
+                .sprint-section {
                     border: 1px solid #ddd;
                     border-radius: 8px;
                     padding: 15px;
                     margin: 25px 0;
-                }}
+                }
                 
-                .sprint-title {{
+                .sprint-title {
                     background-color: #0078d4;
                     color: white;
                     padding: 10px 15px;
                     border-radius: 5px;
                     display: inline-block;
                     margin-bottom: 15px;
-                }}
+                }
                 
-                .sprint-details-table {{
+                .sprint-details-table {
                     width: 100%;
                     border-collapse: collapse;
-                }}
+                }
                 
-                .sprint-details-table th, .sprint-details-table td {{
+                .sprint-details-table th, .sprint-details-table td {
                     padding: 10px;
                     border: 1px solid #ddd;
-                }}
+                }
                 
-                .sprint-details-table th {{
+                .sprint-details-table th {
                     background-color: #f5f5f5;
-                }}
+                }
                 
-                .collapsible {{
+                .collapsible {
                     background-color: #f1f1f1;
                     color: #444;
                     cursor: pointer;
@@ -661,52 +734,52 @@ class ReportGenerator:
                     font-size: 16px;
                     border-radius: 5px;
                     margin-bottom: 5px;
-                }}
+                }
                 
-                .active, .collapsible:hover {{
+                .active, .collapsible:hover {
                     background-color: #ddd;
-                }}
+                }
                 
-                .content {{
+                .content {
                     padding: 0 18px;
                     max-height: 0;
                     overflow: hidden;
                     transition: max-height 0.2s ease-out;
                     background-color: #f9f9f9;
                     border-radius: 0 0 5px 5px;
-                }}
+                }
                 
-                @media print {{
-                    .card, .sprint-section {{
+                @media print {
+                    .card, .sprint-section {
                         break-inside: avoid;
-                    }}
-                    .image-container {{
+                    }
+                    .image-container {
                         break-inside: avoid;
                         page-break-inside: avoid;
-                    }}
-                }}
+                    }
+                }
             </style>
         </head>
         
         <body>
             <h1>Relatório Consolidado de Sprints</h1>
-            <h2>Sprints: {', '.join(nomes_sprints)}</h2>
+            <h2>Sprints: $sprints_lista</h2>
             
             <div class="dashboard">
                 <div class="card">
-                    <div class="metric">{insights_consolidados["total_sprints"]}</div>
+                    <div class="metric">$total_sprints</div>
                     <div class="metric-label">Total de Sprints Analisadas</div>
                 </div>
                 <div class="card">
-                    <div class="metric">{insights_consolidados["total_itens"]}</div>
+                    <div class="metric">$total_itens</div>
                     <div class="metric-label">Total de Itens de Trabalho</div>
                 </div>
                 <div class="card">
-                    <div class="metric">{insights_consolidados["total_esforco"]}</div>
+                    <div class="metric">$total_esforco</div>
                     <div class="metric-label">Pontos de Esforço Total</div>
                 </div>
                 <div class="card">
-                    <div class="metric">{insights_consolidados["media_percentual_concluido"]:.1f}%</div>
+                    <div class="metric">$media_percentual_concluido%</div>
                     <div class="metric-label">Taxa Média de Conclusão</div>
                 </div>
             </div>
@@ -715,28 +788,28 @@ class ReportGenerator:
             <h3>Análise de Chamados</h3>
             <div class="card">
                 <div class="stats-container">
-                    <div class="stat">Total de Chamados: {insights_consolidados.get("total_chamados", 0)}</div>
-                    <div class="stat">Chamados Concluídos: {insights_consolidados.get("chamados_concluidos", 0)}</div>
-                    <div class="stat">Percentual: {(insights_consolidados.get("chamados_concluidos", 0) / insights_consolidados.get("total_chamados", 1) * 100) if insights_consolidados.get("total_chamados", 0) > 0 else 0:.1f}%</div>
+                    <div class="stat">Total de Chamados: $total_chamados</div>
+                    <div class="stat">Chamados Concluídos: $chamados_concluidos</div>
+                    <div class="stat">Percentual: $percentual_chamados%</div>
                 </div>
                 <div class="progress-container">
-                    <div class="progress-bar" style="width: {(insights_consolidados.get("chamados_concluidos", 0) / insights_consolidados.get("total_chamados", 1) * 100) if insights_consolidados.get("total_chamados", 0) > 0 else 0}%"></div>
+                    <div class="progress-bar" style="width: $percentual_chamados%"></div>
                 </div>
-                <p>Ao longo das {insights_consolidados["total_sprints"]} sprints analisadas, foram registrados <strong>{insights_consolidados.get("total_chamados", 0)}</strong> chamados,
-                dos quais <strong>{insights_consolidados.get("chamados_concluidos", 0)}</strong> foram concluídos.</p>
+                <p>Ao longo das $total_sprints sprints analisadas, foram registrados <strong>$total_chamados</strong> chamados,
+                dos quais <strong>$chamados_concluidos</strong> foram concluídos.</p>
             </div>
             
             <h3>Resumo Consolidado</h3>
             <p>
-                Este relatório analisa um total de {insights_consolidados["total_sprints"]} sprints, contendo {insights_consolidados["total_itens"]} itens de trabalho
-                com um esforço total de {insights_consolidados["total_esforco"]} pontos.
+                Este relatório analisa um total de $total_sprints sprints, contendo $total_itens itens de trabalho
+                com um esforço total de $total_esforco pontos.
             </p>
             <p>
-                Em média, cada sprint contém {insights_consolidados["media_itens_sprint"]:.1f} itens de trabalho com {insights_consolidados["media_esforco_sprint"]:.1f} pontos de esforço.
-                A taxa média de conclusão foi de {insights_consolidados["media_percentual_concluido"]:.1f}%.
+                Em média, cada sprint contém $media_itens_sprint itens de trabalho com $media_esforco_sprint pontos de esforço.
+                A taxa média de conclusão foi de $media_percentual_concluido%.
             </p>
             <p>
-                Ao longo dessas sprints, ocorreram em média {insights_consolidados["media_retornos_por_sprint"]:.1f} retornos por sprint,
+                Ao longo dessas sprints, ocorreram em média $media_retornos_por_sprint retornos por sprint,
                 o que sugere um determinado nível de retrabalho no processo de desenvolvimento.
             </p>
             
@@ -744,32 +817,22 @@ class ReportGenerator:
             
             <h4>Tendência de Conclusão</h4>
             <div class="image-container">
-                {graficos_tendencia_html.get('tendencia_conclusao', '<div>Gráfico não disponível</div>')}
+                $grafico_tendencia_conclusao
             </div>
             
             <h4>Tendência de Esforço</h4>
             <div class="image-container">
-                {graficos_tendencia_html.get('tendencia_esforco', '<div>Gráfico não disponível</div>')}
+                $grafico_tendencia_esforco
             </div>
             
             <h3>Comparação Entre Sprints</h3>
-            <table>
-                <tr>
-                    <th>Sprint</th>
-                    <th>Itens</th>
-                    <th>Esforço</th>
-                    <th>Taxa de Conclusão</th>
-                    <th>Chamados</th>
-                    <th>Retornos</th>
-                </tr>
-                {self._gerar_linhas_tabela_sprints(nomes_sprints, insights_consolidados)}
-            </table>
+            $tabela_comparativa_sprints
             
             <h3>Recomendações</h3>
             <ul>
                 <li>Analisar tendências de conclusão para identificar melhorias ou regressões no processo ao longo do tempo</li>
                 <li>Comparar o esforço estimado entre sprints para verificar consistência no planejamento</li>
-                <li>Investigar sprints com taxas de conclusão significativamente abaixo da média ({insights_consolidados["media_percentual_concluido"]:.1f}%)</li>
+                <li>Investigar sprints com taxas de conclusão significativamente abaixo da média ($media_percentual_concluido%)</li>
                 <li>Avaliar sprint com maior número de retornos para identificar causas de retrabalho</li>
                 <li>Revisar a capacidade da equipe baseada na tendência de esforço total por sprint</li>
             </ul>
@@ -778,424 +841,153 @@ class ReportGenerator:
             <h3>Detalhes por Sprint</h3>
             <p>Clique em cada sprint para ver detalhes. Para visualizar gráficos detalhados, acesse o relatório individual de cada sprint.</p>
             
-            {sprint_sections_html}
+            $sprint_sections
             
-            <p><em>Relatório gerado em {datetime.now().strftime("%d/%m/%Y %H:%M:%S")} pelo time de Payments 💙 | Sistema Boletinho Analytics</em></p>
+            <p><em>Relatório gerado em $gerado_em pelo time de Payments 💙 | Sistema Boletinho Analytics</em></p>
             
             <script>
                 // Script para os elementos colapsáveis
                 var coll = document.getElementsByClassName("collapsible");
-                for (var i = 0; i < coll.length; i++) {{
-                    coll[i].addEventListener("click", function() {{
+                for (var i = 0; i < coll.length; i++) {
+                    coll[i].addEventListener("click", function() {
                         this.classList.toggle("active");
                         var content = this.nextElementSibling;
-                        if (content.style.maxHeight) {{
+                        if (content.style.maxHeight) {
                             content.style.maxHeight = null;
-                        }} else {{
+                        } else {
                             content.style.maxHeight = content.scrollHeight + "px";
-                        }}
-                    }});
-                }}
+                        }
+                    });
+                }
             </script>
         </body>
         </html>
-        """
-
-        return html
+    """)
+)
 
-    def _gerar_graficos_tendencia_plotly(self, insights_consolidados):
-        """
-        Gera gráficos de tendência Plotly ao longo das sprints.
-
-        Parameters
-        ----------
-        insights_consolidados : dict
-            Dados consolidados das sprints
-
-        Returns
-        -------
-        dict
-            Dicionário com objetos Plotly
-        """
-        graficos = {}
-
-        # Gráfico combinado de tendência de conclusão e esforço
-        if (
-            insights_consolidados["tendencia_conclusao"]
-            and insights_consolidados["tendencia_esforco"]
-        ):
-            sprints_conclusao = [
-                item["sprint"] for item in insights_consolidados["tendencia_conclusao"]
-            ]
-            percentuais = [
-                item["percentual"]
-                for item in insights_consolidados["tendencia_conclusao"]
-            ]
-
-            sprints_esforco = [
-                item["sprint"] for item in insights_consolidados["tendencia_esforco"]
-            ]
-            esforcos = [
-                item["esforco"] for item in insights_consolidados["tendencia_esforco"]
-            ]
-
-            # Verificar se as listas de sprints são iguais
-            if sprints_conclusao == sprints_esforco:
-                sprints = sprints_conclusao
-
-                # Criar figura com dois eixos Y
-                fig = go.Figure()
-
-                # Adicionar taxa de conclusão (eixo Y primário)
-                fig.add_trace(
-                    go.Scatter(
-                        x=sprints,
-                        y=percentuais,
-                        mode="lines+markers",
-                        name="Taxa de Conclusão (%)",
-                        marker=dict(color="#0078d4", size=10),
-                        line=dict(color="#0078d4", width=2),
-                    )
-                )
-
-                # Adicionar esforço total (eixo Y secundário)
-                fig.add_trace(
-                    go.Scatter(
-                        x=sprints,
-                        y=esforcos,
-                        mode="lines+markers",
-                        name="Esforço Total (pontos)",
-                        marker=dict(color="#27ae60", size=10),
-                        line=dict(color="#27ae60", width=2),
-                        yaxis="y2",
-                    )
-                )
-
-                # Configurar layout com dois eixos Y
-                fig.update_layout(
-                    title="Tendência de Conclusão e Esforço por Sprint",
-                    xaxis=dict(
-                        title=dict(text="Sprint", font=dict(color="#333333")),
-                        tickfont=dict(color="#333333"),
-                    ),
-                    yaxis=dict(
-                        title=dict(
-                            text="Taxa de Conclusão (%)", font=dict(color="#0078d4")
-                        ),
-                        tickfont=dict(color="#0078d4"),
-                        side="left",
-                    ),
-                    yaxis2=dict(
-                        title=dict(
-                            text="Pontos de Esforço", font=dict(color="#27ae60")
-                        ),
-                        tickfont=dict(color="#27ae60"),
-                        overlaying="y",
-                        side="right",
-                    ),
-                    height=500,
-                    template="plotly_white",
-                    legend=dict(
-                        orientation="h",
-                        yanchor="bottom",
-                        y=1.02,
-                        xanchor="center",
-                        x=0.5,
-                    ),
-                    margin=dict(l=60, r=60, t=80, b=60),
-                )
-
-                graficos["tendencia_combinada"] = fig
-            else:
-                # Se as listas de sprints não forem iguais, criar gráficos separados
-                logger.warning(
-                    "As listas de sprints para conclusão e esforço são diferentes. Criando gráficos separados."
-                )
-
-                # Gráfico de tendência de conclusão
-                fig_conclusao = go.Figure()
-                fig_conclusao.add_trace(
-                    go.Scatter(
-                        x=sprints_conclusao,
-                        y=percentuais,
-                        mode="lines+markers",
-                        name="Taxa de Conclusão",
-                        marker=dict(color="#0078d4", size=10),
-                        line=dict(color="#0078d4", width=2),
-                    )
-                )
-                fig_conclusao.update_layout(
-                    title="Tendência de Conclusão por Sprint",
-                    xaxis_title="Sprint",
-                    yaxis_title="Percentual de Conclusão (%)",
-                    height=500,
-                    template="plotly_white",
-                )
-                graficos["tendencia_conclusao"] = fig_conclusao
 
-                # Gráfico de tendência de esforço
-                fig_esforco = go.Figure()
-                fig_esforco.add_trace(
-                    go.Scatter(
-                        x=sprints_esforco,
-                        y=esforcos,
-                        mode="lines+markers",
-                        name="Esforço Total",
-                        marker=dict(color="#27ae60", size=10),
-                        line=dict(color="#27ae60", width=2),
-                    )
-                )
-                fig_esforco.update_layout(
-                    title="Tendência de Esforço por Sprint",
-                    xaxis_title="Sprint",
-                    yaxis_title="Pontos de Esforço",
-                    height=500,
-                    template="plotly_white",
-                )
-                graficos["tendencia_esforco"] = fig_esforco
-
-        return graficos
-
-    def _gerar_html_consolidado_com_plotly(
-        self,
-        nomes_sprints,
-        insights_consolidados,
-        graficos_tendencia,
-        graficos_por_sprint,
-    ):
-        """
-        Gera HTML consolidado com gráficos Plotly embutidos.
-
-        Parameters
-        ----------
-        nomes_sprints : list
-            Lista de nomes das sprints
-        insights_consolidados : dict
-            Insights consolidados
-        graficos_tendencia : dict
-            Gráficos de tendência Plotly
-        graficos_por_sprint : dict
-            Dicionário com gráficos Plotly por sprint
-
-        Returns
-        -------
-        str
-            HTML gerado
-        """
-        # Gera os gráficos como HTML
-        # Só inclui o Plotly.js uma vez
-        include_plotlyjs = "cdn"
-
-        # Converte os gráficos de tendência
-        graficos_tendencia_html = {}
-        for nome, fig in graficos_tendencia.items():
-            graficos_tendencia_html[nome] = fig.to_html(
-                include_plotlyjs=include_plotlyjs,
-                full_html=False,
-                config={"responsive": True},
-            )
-            include_plotlyjs = False
-
-        # Converte os gráficos por sprint
-        graficos_sprint_html = {}
-        for sprint, graficos in graficos_por_sprint.items():
-            graficos_sprint_html[sprint] = {}
-            for nome, fig in graficos.items():
-                try:
-                    graficos_sprint_html[sprint][nome] = fig.to_html(
-                        include_plotlyjs=False,  # Já incluído acima
-                        full_html=False,
-                        config={"responsive": True},
-                    )
-                except Exception as e:
-                    logger.error(
-                        f"Erro ao converter gráfico {nome} da sprint {sprint}: {str(e)}"
-                    )
-                    graficos_sprint_html[sprint][
-                        nome
-                    ] = f"<div>Erro ao gerar gráfico: {nome}</div>"
-
-        # Cria HTML para o dropdown das sprints e seus gráficos
-        sprint_sections_html = ""
-        for sprint in nomes_sprints:
-            graphs = graficos_sprint_html.get(sprint, {})
-
-            sprint_section = f"""
-            <button class="collapsible">{sprint}</button>
-            <div class="content">
-                <div class="sprint-section">
-                    <div class="sprint-title">{sprint}</div>
-                    
-                    <h4>Itens de Trabalho por Tipo</h4>
-                    <div class="image-container">
-                        {graphs.get('itens_por_tipo', '<div>Gráfico não disponível</div>')}
-                    </div>
-                    
-                    <h4>Distribuição de Estado Atual</h4>
-                    <div class="image-container">
-                        {graphs.get('itens_por_estado', '<div>Gráfico não disponível</div>')}
-                    </div>
-                    
-                    <div class="sprint-grid">
-                        <div>
-                            <h4>Carga de Trabalho por Responsável</h4>
-                            <div class="image-container">
-                                {graphs.get('itens_por_responsavel', '<div>Gráfico não disponível</div>')}
-                            </div>
-                        </div>
-                        <div>
-                            <h4>Esforço por Responsável</h4>
-                            <div class="image-container">
-                                {graphs.get('esforco_por_responsavel', '<div>Gráfico não disponível</div>')}
-                            </div>
-                        </div>
-                    </div>
-                    
-                    <h4>Tempo Médio em Coluna</h4>
-                    <div class="image-container">
-                        {graphs.get('tempo_medio_coluna', '<div>Gráfico não disponível</div>')}
-                    </div>
-                    
-                    <div class="sprint-grid">
-                        <div>
-                            <h4>Adições no Meio da Sprint</h4>
-                            <div class="image-container">
-                                {graphs.get('adicoes_meio_sprint', '<div>Gráfico não disponível</div>')}
-                            </div>
-                        </div>
-                        <div>
-                            <h4>Retornos</h4>
-                            <div class="image-container">
-                                {graphs.get('retornos', '<div>Gráfico não disponível</div>')}
-                            </div>
-                        </div>
-                    </div>
-                </div>
-            </div>
-            """
-            sprint_sections_html += sprint_section
-
-        # Gera o HTML completo
-        html = f"""
+_TEMPLATE_RELATORIO_CONSOLIDADO_COMPLETO = Template(
+    _minificar_css("""
         <!DOCTYPE html>
         <html>
         <head>
             <title>Relatório Consolidado de Sprints</title>
             <meta charset="UTF-8">
+            $script_plotly
             <style>
-                body {{
+                body {
                     font-family: Arial, sans-serif;
                     line-height: 1.6;
                     color: #333;
                     max-width: 1200px;
                     margin: 0 auto;
                     padding: 20px;
-                }}
+                }
                 
-                h1, h2, h3, h4 {{
+                h1, h2, h3, h4 {
                     color: #0078d4;
-                }}
+                }
                 
-                .dashboard {{
+                .dashboard {
                     display: grid;
                     grid-template-columns: repeat(2, 1fr);
                     gap: 20px;
                     margin-bottom: 30px;
-                }}
+                }
                 
-                .card {{
+                .card {
                     background: #f9f9f9;
                     border-radius: 8px;
                     padding: 20px;
                     box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
-                }}
+                }
                 
-                .metric {{
+                .metric {
                     font-size: 24px;
                     font-weight: bold;
                     color: #0078d4;
                     margin-bottom: 8px;
-                }}
+                }
                 
-                .metric-label {{
+                .metric-label {
                     font-size: 14px;
                     color: #666;
-                }}
+                }
                 
-                table {{
+                table {
                     width: 100%;
                     border-collapse: collapse;
                     margin: 20px 0;
-                }}
+                }
                 
-                th, td {{
+                th, td {
                     padding: 12px;
                     text-align: left;
                     border-bottom: 1px solid #ddd;
-                }}
+                }
                 
-                th {{
+                th {
                     background-color: #f2f2f2;
-                }}
+                }
                 
-                .warning {{
+                .warning {
                     color: #e74c3c;
-                }}
+                }
                 
-                .success {{
+                .success {
                     color: #27ae60;
-                }}
+                }
                 
-                .image-container {{
+                .image-container {
                     margin: 20px 0;
-                }}
+                }
                 
-                .progress-container {{
+                .progress-container {
                     width: 100%;
                     background-color: #f1f1f1;
                     border-radius: 4px;
                     margin: 10px 0;
-                }}
+                }
                 
-                .progress-bar {{
+                .progress-bar {
                     height: 20px;
                     border-radius: 4px;
                     background-color: #4CAF50;
-                }}
+                }
                 
-                .stats-container {{
+                .stats-container {
                     display: flex;
                     justify-content: space-between;
                     margin-bottom: 10px;
-                }}
+                }
                 
-                .stat {{
+                .stat {
                     font-weight: bold;
-                }}
+                }
                 
-                .sprint-section {{
+                .sprint-section {
                     border: 1px solid #ddd;
                     border-radius: 8px;
                     padding: 15px;
                     margin: 25px 0;
-                }}
+                }
                 
-                .sprint-title {{
+                .sprint-title {
                     background-color: #0078d4;
                     color: white;
                     padding: 10px 15px;
                     border-radius: 5px;
                     display: inline-block;
                     margin-bottom: 15px;
-                }}
+                }
                 
-                .sprint-grid {{
+                .sprint-grid {
                     display: grid;
                     grid-template-columns: repeat(2, 1fr);
                     gap: 15px;
-                }}
+                }
                 
-                .collapsible {{
+                .collapsible {
                     background-color: #f1f1f1;
                     color: #444;
                     cursor: pointer;
@@ -1207,52 +999,52 @@ class ReportGenerator:
                     font-size: 16px;
                     border-radius: 5px;
                     margin-bottom: 5px;
-                }}
+                }
                 
-                .active, .collapsible:hover {{
+                .active, .collapsible:hover {
                     background-color: #ddd;
-                }}
+                }
                 
-                .content {{
+                .content {
                     padding: 0 18px;
                     max-height: 0;
                     overflow: hidden;
                     transition: max-height 0.2s ease-out;
                     background-color: #f9f9f9;
                     border-radius: 0 0 5px 5px;
-                }}
+                }
                 
-                @media print {{
-                    .card, .sprint-section {{
+                @media print {
+                    .card, .sprint-section {
                         break-inside: avoid;
-                    }}
-                    .image-container {{
+                    }
+                    .image-container {
                         break-inside: avoid;
                         page-break-inside: avoid;
-                    }}
-                }}
+                    }
+                }
             </style>
         </head>
         
         <body>
             <h1>Relatório Consolidado de Sprints</h1>
-            <h2>Sprints: {', '.join(nomes_sprints)}</h2>
+            <h2>Sprints: $sprints_lista</h2>
             
             <div class="dashboard">
                 <div class="card">
-                    <div class="metric">{insights_consolidados["total_sprints"]}</div>
+                    <div class="metric">$total_sprints</div>
                     <div class="metric-label">Total de Sprints Analisadas</div>
                 </div>
                 <div class="card">
-                    <div class="metric">{insights_consolidados["total_itens"]}</div>
+                    <div class="metric">$total_itens</div>
                     <div class="metric-label">Total de Itens de Trabalho</div>
                 </div>
                 <div class="card">
-                    <div class="metric">{insights_consolidados["total_esforco"]}</div>
+                    <div class="metric">$total_esforco</div>
                     <div class="metric-label">Pontos de Esforço Total</div>
                 </div>
                 <div class="card">
-                    <div class="metric">{insights_consolidados["media_percentual_concluido"]:.1f}%</div>
+                    <div class="metric">$media_percentual_concluido%</div>
                     <div class="metric-label">Taxa Média de Conclusão</div>
                 </div>
             </div>
@@ -1261,28 +1053,28 @@ class ReportGenerator:
             <h3>Análise de Chamados</h3>
             <div class="card">
                 <div class="stats-container">
-                    <div class="stat">Total de Chamados: {insights_consolidados.get("total_chamados", 0)}</div>
-                    <div class="stat">Chamados Concluídos: {insights_consolidados.get("chamados_concluidos", 0)}</div>
-                    <div class="stat">Percentual: {(insights_consolidados.get("chamados_concluidos", 0) / insights_consolidados.get("total_chamados", 1) * 100) if insights_consolidados.get("total_chamados", 0) > 0 else 0:.1f}%</div>
+                    <div class="stat">Total de Chamados: $total_chamados</div>
+                    <div class="stat">Chamados Concluídos: $chamados_concluidos</div>
+                    <div class="stat">Percentual: $percentual_chamados%</div>
                 </div>
                 <div class="progress-container">
-                    <div class="progress-bar" style="width: {(insights_consolidados.get("chamados_concluidos", 0) / insights_consolidados.get("total_chamados", 1) * 100) if insights_consolidados.get("total_chamados", 0) > 0 else 0}%"></div>
+                    <div class="progress-bar" style="width: $percentual_chamados%"></div>
                 </div>
-                <p>Ao longo das {insights_consolidados["total_sprints"]} sprints analisadas, foram registrados <strong>{insights_consolidados.get("total_chamados", 0)}</strong> chamados,
-                dos quais <strong>{insights_consolidados.get("chamados_concluidos", 0)}</strong> foram concluídos.</p>
+                <p>Ao longo das $total_sprints sprints analisadas, foram registrados <strong>$total_chamados</strong> chamados,
+                dos quais <strong>$chamados_concluidos</strong> foram concluídos.</p>
             </div>
             
             <h3>Resumo Consolidado</h3>
             <p>
-                Este relatório analisa um total de {insights_consolidados["total_sprints"]} sprints, contendo {insights_consolidados["total_itens"]} itens de trabalho
-                com um esforço total de {insights_consolidados["total_esforco"]} pontos.
+                Este relatório analisa um total de $total_sprints sprints, contendo $total_itens itens de trabalho
+                com um esforço total de $total_esforco pontos.
             </p>
             <p>
-                Em média, cada sprint contém {insights_consolidados["media_itens_sprint"]:.1f} itens de trabalho com {insights_consolidados["media_esforco_sprint"]:.1f} pontos de esforço.
-                A taxa média de conclusão foi de {insights_consolidados["media_percentual_concluido"]:.1f}%.
+                Em média, cada sprint contém $media_itens_sprint itens de trabalho com $media_esforco_sprint pontos de esforço.
+                A taxa média de conclusão foi de $media_percentual_concluido%.
             </p>
             <p>
-                Ao longo dessas sprints, ocorreram em média {insights_consolidados["media_retornos_por_sprint"]:.1f} retornos por sprint,
+                Ao longo dessas sprints, ocorreram em média $media_retornos_por_sprint retornos por sprint,
                 o que sugere um determinado nível de retrabalho no processo de desenvolvimento.
             </p>
             
@@ -1290,32 +1082,22 @@ class ReportGenerator:
             
             <h4>Tendência de Conclusão</h4>
             <div class="image-container">
-                {graficos_tendencia_html.get('tendencia_conclusao', '<div>Gráfico não disponível</div>')}
+                $grafico_tendencia_conclusao
             </div>
             
             <h4>Tendência de Esforço</h4>
             <div class="image-container">
-                {graficos_tendencia_html.get('tendencia_esforco', '<div>Gráfico não disponível</div>')}
+                $grafico_tendencia_esforco
             </div>
             
             <h3>Comparação Entre Sprints</h3>
-            <table>
-                <tr>
-                    <th>Sprint</th>
-                    <th>Itens</th>
-                    <th>Esforço</th>
-                    <th>Taxa de Conclusão</th>
-                    <th>Chamados</th>
-                    <th>Retornos</th>
-                </tr>
-                {self._gerar_linhas_tabela_sprints(nomes_sprints, insights_consolidados)}
-            </table>
+            $tabela_comparativa_sprints
             
             <h3>Recomendações</h3>
             <ul>
                 <li>Analisar tendências de conclusão para identificar melhorias ou regressões no processo ao longo do tempo</li>
                 <li>Comparar o esforço estimado entre sprints para verificar consistência no planejamento</li>
-                <li>Investigar sprints com taxas de conclusão significativamente abaixo da média ({insights_consolidados["media_percentual_concluido"]:.1f}%)</li>
+                <li>Investigar sprints com taxas de conclusão significativamente abaixo da média ($media_percentual_concluido%)</li>
                 <li>Avaliar sprint com maior número de retornos para identificar causas de retrabalho</li>
                 <li>Revisar a capacidade da equipe baseada na tendência de esforço total por sprint</li>
             </ul>
@@ -1324,34 +1106,897 @@ class ReportGenerator:
             <h3>Detalhes por Sprint</h3>
             <p>Clique em cada sprint para ver seus gráficos detalhados.</p>
             
-            {sprint_sections_html}
+            $sprint_sections
             
-            <p><em>Relatório gerado em {datetime.now().strftime("%d/%m/%Y %H:%M:%S")} pelo time de Payments 💙 | Sistema Boletinho Analytics</em></p>
+            <p><em>Relatório gerado em $gerado_em pelo time de Payments 💙 | Sistema Boletinho Analytics</em></p>
             
             <script>
-                // Script para os elementos colapsáveis
+                // Script para os elementos colapsáveis; os gráficos da
+                // seção só são montados na primeira expansão
+                function renderLazyPlots(content) {
+                    var plots = content.querySelectorAll(".lazy-plot:not([data-rendered])");
+                    for (var j = 0; j < plots.length; j++) {
+                        var el = plots[j];
+                        var spec = JSON.parse(
+                            document.getElementById(el.dataset.figId + "_spec").textContent
+                        );
+                        Plotly.newPlot(el, spec.data, spec.layout, {responsive: true});
+                        el.dataset.rendered = "1";
+                    }
+                }
                 var coll = document.getElementsByClassName("collapsible");
-                for (var i = 0; i < coll.length; i++) {{
-                    coll[i].addEventListener("click", function() {{
+                for (var i = 0; i < coll.length; i++) {
+                    coll[i].addEventListener("click", function() {
                         this.classList.toggle("active");
                         var content = this.nextElementSibling;
-                        if (content.style.maxHeight) {{
+                        if (content.style.maxHeight) {
                             content.style.maxHeight = null;
-                        }} else {{
+                        } else {
+                            renderLazyPlots(content);
                             content.style.maxHeight = content.scrollHeight + "px";
-                        }}
-                    }});
-                }}
+                        }
+                    });
+                }
             </script>
         </body>
         </html>
+    """)
+)
+
+
+def _compilar_segmentos(template):
+    """
+    Divide um Template em segmentos estáticos e nomes de placeholder.
+
+    Os trechos estáticos já saem codificados em bytes, prontos para a
+    escrita em streaming feita por ``_escrever_segmentos``.
+
+    Parameters
+    ----------
+    template : string.Template
+        Template a ser segmentado
+
+    Returns
+    -------
+    list
+        Segmentos intercalados: bytes (trecho estático) ou str (nome
+        de placeholder)
+    """
+    segmentos = []
+    texto = template.template
+    pos = 0
+    for m in Template.pattern.finditer(texto):
+        nome = m.group("named") or m.group("braced")
+        if nome is None:
+            continue
+        segmentos.append(texto[pos : m.start()].encode("utf-8"))
+        segmentos.append(nome)
+        pos = m.end()
+    segmentos.append(texto[pos:].encode("utf-8"))
+    return segmentos
+
+
+_SEGMENTOS_RELATORIO_EXECUTIVO = _compilar_segmentos(_TEMPLATE_RELATORIO_EXECUTIVO)
+_SEGMENTOS_RELATORIO_CONSOLIDADO = _compilar_segmentos(_TEMPLATE_RELATORIO_CONSOLIDADO)
+
+
+def _escrever_segmentos(destino, segmentos, contexto):
+    """
+    Escreve um template segmentado diretamente em um arquivo binário.
+
+    O documento nunca é materializado como uma única string de vários
+    megabytes: cada trecho estático e cada valor do contexto (incluindo
+    os fragmentos grandes de gráfico) vai direto ao buffer do arquivo.
+
+    Parameters
+    ----------
+    destino : file object
+        Arquivo aberto em modo binário
+    segmentos : list
+        Saída de ``_compilar_segmentos``
+    contexto : dict
+        Valores dos placeholders
+    """
+    for segmento in segmentos:
+        if isinstance(segmento, bytes):
+            destino.write(segmento)
+        else:
+            destino.write(str(contexto[segmento]).encode("utf-8"))
+
+
+class ReportGenerator:
+    """Classe para geração de relatórios e visualizações dos dados de sprint."""
+
+    def __init__(self, sprint_analyzer):
+        """
+        Inicializa o gerador de relatórios.
+
+        Parameters
+        ----------
+        sprint_analyzer : SprintAnalyzer
+            Analisador de sprint para acesso a dados e configurações
+        """
+        self.sprint_analyzer = sprint_analyzer
+        # Cache em memória das seções por sprint do relatório
+        # consolidado completo, chaveado por nome + hash dos dados da
+        # sprint (ver _gerar_html_consolidado_com_plotly)
+        self._cache_secoes_sprint = {}
+        # Cache em memória das figuras por sprint, chaveado por hash
+        # dos dados processados (ver gerar_graficos_plotly)
+        self._cache_graficos = {}
+
+    def _fig_para_html(self, fig, div_id):
+        """
+        Converte uma figura Plotly em um fragmento HTML mínimo.
+
+        ``pio.to_json`` serializa a figura diretamente (com engine
+        orjson quando disponível), sem o deepcopy interno que
+        ``fig.to_html`` faz via ``fig.to_dict()`` — as figuras geradas
+        aqui não são mutadas depois, então a cópia defensiva é
+        desnecessária. O bundle plotly.min.js é embutido uma única vez
+        no <head> de cada relatório (ver _script_plotly_inline).
+
+        Parameters
+        ----------
+        fig : plotly.graph_objects.Figure
+            Figura a ser convertida
+        div_id : str
+            ID do elemento <div> que receberá o gráfico
+
+        Returns
+        -------
+        str
+            Fragmento HTML com o <div> e o <script> de montagem
+        """
+        spec = pio.to_json(fig, validate=False)
+        return (
+            f'<div id="{div_id}"></div>\n'
+            "<script>(function() {\n"
+            f"    var spec = {spec};\n"
+            f'    Plotly.newPlot("{div_id}", spec.data, spec.layout,'
+            ' {"responsive": true});\n'
+            "})();</script>"
+        )
+
+    def _fig_para_html_preguicoso(self, fig, div_id):
+        """
+        Converte uma figura em um placeholder de renderização adiada.
+
+        O JSON da figura é embutido em um <script type="application/json">
+        (sem necessidade de escape) e o <div> fica vazio; o Plotly só é
+        invocado quando a seção colapsável que o contém é expandida pela
+        primeira vez, tirando N*8 inicializações do carregamento da
+        página consolidada.
+
+        Parameters
+        ----------
+        fig : plotly.graph_objects.Figure
+            Figura a ser convertida
+        div_id : str
+            ID do elemento <div> que receberá o gráfico
+
+        Returns
+        -------
+        str
+            Fragmento HTML com o placeholder e o JSON da figura
+        """
+        spec = pio.to_json(fig, validate=False)
+        return (
+            f'<div id="{div_id}" class="lazy-plot" data-fig-id="{div_id}"></div>\n'
+            f'<script type="application/json" id="{div_id}_spec">{spec}</script>'
+        )
+
+    def _fig_para_html_cacheado(self, fig, nome, pasta_cache, mtime_dados):
+        """
+        Converte uma figura em HTML com memoização em disco.
+
+        O fragmento é indexado pelo nome do gráfico e pelo mtime de
+        ``dados_processados.json``: regerar o relatório sem mudar os
+        dados reaproveita o HTML gravado e pula a serialização da
+        figura inteira. Apagar a pasta ``.fig_cache`` invalida tudo.
+
+        Parameters
+        ----------
+        fig : plotly.graph_objects.Figure
+            Figura a ser convertida
+        nome : str
+            Nome do gráfico (chave em graficos_plotly)
+        pasta_cache : Path or None
+            Pasta do cache de fragmentos; None desativa a memoização
+        mtime_dados : float or None
+            mtime do arquivo de dados de origem; None desativa a
+            memoização
+
+        Returns
+        -------
+        str
+            Fragmento HTML com o <div> e o <script> de montagem
+        """
+        if pasta_cache is None or mtime_dados is None:
+            return self._fig_para_html(fig, f"grafico_{nome}")
+
+        chave = hashlib.blake2b(f"{nome}:{mtime_dados}".encode()).hexdigest()[:16]
+        arquivo_cache = Path(pasta_cache) / f"{chave}.html"
+        if arquivo_cache.exists():
+            return arquivo_cache.read_text(encoding="utf-8")
+
+        fragmento = self._fig_para_html(fig, f"grafico_{nome}")
+        arquivo_cache.parent.mkdir(exist_ok=True, parents=True)
+        arquivo_cache.write_text(fragmento, encoding="utf-8")
+        return fragmento
+
+    def _fig_para_svg(self, fig):
+        """
+        Converte uma figura Plotly em SVG inline via kaleido.
+
+        Usado no modo estático do relatório consolidado: o HTML
+        resultante não referencia o plotly.min.js nem executa JS ao
+        abrir, o que atende consumidores de impressão/PDF.
+
+        Parameters
+        ----------
+        fig : plotly.graph_objects.Figure
+            Figura a ser convertida
+
+        Returns
+        -------
+        str
+            Markup SVG da figura, ou um aviso em caso de erro
+        """
+        try:
+            return pio.to_image(fig, format="svg").decode("utf-8")
+        except Exception as e:
+            logger.error(f"Erro ao converter figura para SVG: {str(e)}")
+            return _GRAFICO_INDISPONIVEL
+
+    def gerar_graficos_plotly(self, dados_processados, nome_sprint):
+        """
+        Gera gráficos interativos Plotly para os dados da sprint.
+
+        Parameters
+        ----------
+        dados_processados : list
+            Lista de itens processados
+        nome_sprint : str
+            Nome da sprint
+
+        Returns
+        -------
+        dict
+            Dicionário com objetos de figura do Plotly
+        """
+        logger.info(f"Gerando gráficos interativos para sprint: {nome_sprint}")
+
+        graficos = {}
+
+        # Implementação dos gráficos interativos
+        # Esta função será implementada posteriormente
+
+        return graficos
+
+    def gerar_relatorio_executivo(self, nome_sprint, pasta_saida):
+        """
+        Gera relatório executivo HTML com insights e visualizações.
+
+        Parameters
+        ----------
+        nome_sprint : str
+            Nome da sprint
+        pasta_saida : Path
+            Caminho com dados e visualizações
+
+        Returns
+        -------
+        str
+            Caminho para o relatório HTML gerado
+        """
+        logger.info(f"Gerando relatório executivo para sprint: {nome_sprint}")
+
+        arquivo_saida = pasta_saida / "relatorio_executivo.html"
+
+        # Verifica se temos os dados necessários
+        if not (pasta_saida / "insights.json").exists():
+            logger.error(f"Arquivo de insights não encontrado em {pasta_saida}")
+            return None
+
+        # Carrega os insights
+        insights = _carregar_json(pasta_saida / "insights.json")
+
+        # Carrega dados processados para gerar gráficos Plotly
+        dados_processados_path = pasta_saida / "dados_processados.json"
+        mtime_dados = None
+        if dados_processados_path.exists():
+            mtime_dados = dados_processados_path.stat().st_mtime
+            dados_processados = _carregar_json(dados_processados_path)
+            # Gera gráficos Plotly
+            graficos_plotly = self.gerar_graficos_plotly(dados_processados, nome_sprint)
+        else:
+            logger.error(
+                f"Arquivo de dados processados não encontrado: {dados_processados_path}"
+            )
+            graficos_plotly = {}
+
+        # Monta o contexto com os gráficos Plotly (fragmentos
+        # memoizados em disco enquanto dados_processados.json não mudar)
+        contexto = self._montar_contexto_executivo(
+            nome_sprint,
+            insights,
+            graficos_plotly,
+            pasta_cache=pasta_saida / ".fig_cache",
+            mtime_dados=mtime_dados,
+        )
+
+        # Grava em streaming: cabeçalho, fragmentos de gráfico e rodapé
+        # vão direto ao buffer do arquivo, sem montar o documento
+        # inteiro em memória
+        with open(arquivo_saida, "wb", buffering=1024 * 1024) as f:
+            _escrever_segmentos(f, _SEGMENTOS_RELATORIO_EXECUTIVO, contexto)
+
+        # Variante .html.gz opcional (nível 1: ~3x menor por um custo
+        # de CPU mínimo), servível direto com Content-Encoding: gzip
+        if os.getenv("REPORT_GZIP"):
+            import gzip
+
+            with gzip.open(f"{arquivo_saida}.gz", "wb", compresslevel=1) as gz:
+                _escrever_segmentos(gz, _SEGMENTOS_RELATORIO_EXECUTIVO, contexto)
+
+        logger.info(f"Relatório executivo gerado: {arquivo_saida}")
+
+        return str(arquivo_saida)
+
+    def _montar_contexto_executivo(
+        self, nome_sprint, insights, graficos_plotly, pasta_cache=None, mtime_dados=None
+    ):
+        """
+        Monta o contexto de valores do relatório executivo.
+
+        Parameters
+        ----------
+        nome_sprint : str
+            Nome da sprint
+        insights : dict
+            Insights da análise
+        graficos_plotly : dict
+            Dicionário com objetos de figura do Plotly
+        pasta_cache : Path, optional
+            Pasta para memoizar os fragmentos de gráfico em disco
+        mtime_dados : float, optional
+            mtime do arquivo de dados que originou os gráficos
+
+        Returns
+        -------
+        dict
+            Contexto pronto para os segmentos do template executivo
+        """
+        # Carimbo de geração calculado uma única vez, fora do caminho
+        # de materialização do template
+        gerado_em = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
+
+        # Gera os gráficos como fragmentos HTML mínimos
+        graficos_html = {}
+
+        for nome, fig in graficos_plotly.items():
+            try:
+                graficos_html[nome] = self._fig_para_html_cacheado(
+                    fig, nome, pasta_cache, mtime_dados
+                )
+            except Exception as e:
+                logger.error(f"Erro ao converter gráfico Plotly para HTML: {str(e)}")
+                graficos_html[nome] = f"<div>Erro ao gerar gráfico: {nome}</div>"
+
+
+        # Valores com fallback resolvidos uma única vez, fora do
+        # contexto (alguns aparecem em mais de um ponto do template)
+        total_itens = insights["total_itens"]
+        adicoes_meio_sprint = insights["adicoes_meio_sprint"]
+        retornos = insights["retornos"]
+        retornos_unicos = insights["retornos_unicos"]
+        total_chamados = insights.get("total_chamados", 0)
+        chamados_concluidos = insights.get("chamados_concluidos", 0)
+        percentual_chamados = insights.get("percentual_chamados_concluidos", 0)
+        percentual_esforco = insights.get("percentual_esforco_concluido", 0)
+        percentual_adicoes = (
+            adicoes_meio_sprint / total_itens * 100 if total_itens > 0 else 0
+        )
+
+        # Bloco condicional pré-montado fora do template principal
+        if "retornos" in graficos_html:
+            secao_retornos = _TEMPLATE_SECAO_RETORNOS.substitute(
+                retornos_unicos=retornos_unicos,
+                retornos=retornos,
+                grafico_retornos=graficos_html.get("retornos", _GRAFICO_INDISPONIVEL),
+            )
+        else:
+            secao_retornos = ""
+
+        return {
+            "nome_sprint": nome_sprint,
+            "script_plotly": _script_plotly_inline(),
+            "total_itens": total_itens,
+            "esforco_total": insights["esforco_total"],
+            "percentual_concluido": f"{insights['percentual_concluido']:.1f}",
+            "percentual_esforco_concluido": f"{percentual_esforco:.1f}",
+            "adicoes_meio_sprint": adicoes_meio_sprint,
+            "percentual_adicoes": f"{percentual_adicoes:.1f}",
+            "total_chamados": total_chamados,
+            "chamados_concluidos": chamados_concluidos,
+            "percentual_chamados": f"{percentual_chamados:.1f}",
+            "retornos_unicos": retornos_unicos,
+            "retornos": retornos,
+            "grafico_itens_por_tipo": graficos_html.get(
+                "itens_por_tipo", _GRAFICO_INDISPONIVEL
+            ),
+            "grafico_itens_por_estado": graficos_html.get(
+                "itens_por_estado", _GRAFICO_INDISPONIVEL
+            ),
+            "grafico_itens_por_responsavel": graficos_html.get(
+                "itens_por_responsavel", _GRAFICO_INDISPONIVEL
+            ),
+            "grafico_esforco_por_responsavel": graficos_html.get(
+                "esforco_por_responsavel", _GRAFICO_INDISPONIVEL
+            ),
+            "grafico_tempo_medio_coluna": graficos_html.get(
+                "tempo_medio_coluna", _GRAFICO_INDISPONIVEL
+            ),
+            "grafico_adicoes_meio_sprint": graficos_html.get(
+                "adicoes_meio_sprint", _GRAFICO_INDISPONIVEL
+            ),
+            "retornos_section": secao_retornos,
+            "gerado_em": gerado_em,
+        }
+
+    def gerar_relatorio_consolidado(
+        self, nomes_sprints, pasta_saida, insights_consolidados=None
+    ):
+        """
+        Gera relatório consolidado para múltiplas sprints.
+
+        Parameters
+        ----------
+        nomes_sprints : list
+            Lista de nomes das sprints
+        pasta_saida : Path
+            Caminho para a pasta de saída
+        insights_consolidados : dict, optional
+            Insights já em memória (evita reler o JSON que o analisador
+            acabou de gravar); quando omitido, carrega do arquivo
+
+        Returns
+        -------
+        str
+            Caminho para o relatório gerado
+        """
+        logger.info(f"Gerando relatório consolidado para {len(nomes_sprints)} sprints")
+
+        arquivo_saida = pasta_saida / "relatorio_consolidado.html"
+
+        # Carrega os insights consolidados apenas se não vieram prontos
+        if insights_consolidados is None:
+            insights_consolidados = _carregar_json(
+                pasta_saida / "insights_consolidados.json"
+            )
+
+        # Gera gráficos de tendência com Plotly diretamente a partir dos insights consolidados
+        graficos_tendencia = self._gerar_graficos_tendencia_plotly(
+            insights_consolidados
+        )
+
+        # Monta o contexto com o conteúdo estático para as sprints
+        # individuais, em vez de tentar carregar dados processados
+        contexto = self._montar_contexto_consolidado(
+            nomes_sprints, insights_consolidados, graficos_tendencia
+        )
+
+        # Grava em streaming: cabeçalho, fragmentos de gráfico e rodapé
+        # vão direto ao buffer do arquivo, sem montar o documento
+        # inteiro em memória
+        with open(arquivo_saida, "wb", buffering=1024 * 1024) as f:
+            _escrever_segmentos(f, _SEGMENTOS_RELATORIO_CONSOLIDADO, contexto)
+
+        # Variante .html.gz opcional (nível 1: ~3x menor por um custo
+        # de CPU mínimo), servível direto com Content-Encoding: gzip
+        if os.getenv("REPORT_GZIP"):
+            import gzip
+
+            with gzip.open(f"{arquivo_saida}.gz", "wb", compresslevel=1) as gz:
+                _escrever_segmentos(gz, _SEGMENTOS_RELATORIO_CONSOLIDADO, contexto)
+
+        logger.info(f"Relatório consolidado gerado: {arquivo_saida}")
+
+        return str(arquivo_saida)
+
+    def _montar_contexto_consolidado(
+        self, nomes_sprints, insights_consolidados, graficos_tendencia
+    ):
+        """
+        Monta o contexto do relatório consolidado (tendências + tabelas).
+
+        Parameters
+        ----------
+        nomes_sprints : list
+            Lista de nomes das sprints
+        insights_consolidados : dict
+            Insights consolidados
+        graficos_tendencia : dict
+            Gráficos de tendência Plotly
+
+        Returns
+        -------
+        dict
+            Contexto pronto para os segmentos do template consolidado
+        """
+        # Carimbo de geração calculado uma única vez, fora do caminho
+        # de materialização do template
+        gerado_em = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
+
+        # Converte os gráficos de tendência para fragmentos HTML mínimos
+        graficos_tendencia_html = {
+            nome: self._fig_para_html(fig, f"grafico_{nome}")
+            for nome, fig in graficos_tendencia.items()
+        }
+
+        # Gera HTML para tabelas de sprint em vez de gráficos interativos
+        secoes_sprints = []
+        por_sprint = insights_consolidados["por_sprint"]
+        for sprint in nomes_sprints:
+            # Uma única sonda no dicionário por sprint, em vez do par
+            # pertinência + indexação
+            sprint_data = por_sprint.get(sprint)
+            if sprint_data is None:
+                continue
+
+            # Cria tabela de dados para esta sprint
+            sprint_table = _TEMPLATE_TABELA_SPRINT.substitute(
+                total_itens=sprint_data.get("total_itens", "N/A"),
+                esforco_total=sprint_data.get("esforco_total", "N/A"),
+                percentual_concluido=f"{sprint_data.get('percentual_concluido', 0):.1f}",
+                adicoes_meio_sprint=sprint_data.get("adicoes_meio_sprint", "N/A"),
+                retornos=sprint_data.get("retornos", "N/A"),
+                total_chamados=sprint_data.get("total_chamados", "N/A"),
+                chamados_concluidos=sprint_data.get("chamados_concluidos", "N/A"),
+            )
+
+            secoes_sprints.append(
+                _TEMPLATE_SECAO_SPRINT.substitute(sprint=sprint, tabela=sprint_table)
+            )
+
+        sprint_sections_html = "".join(secoes_sprints)
+
+
+        total_chamados = insights_consolidados.get("total_chamados", 0)
+        chamados_concluidos = insights_consolidados.get("chamados_concluidos", 0)
+        percentual_chamados = (
+            chamados_concluidos / total_chamados * 100 if total_chamados > 0 else 0
+        )
+
+        # Contexto completo do documento
+        return {
+            "script_plotly": _script_plotly_inline(),
+            "sprints_lista": ", ".join(nomes_sprints),
+            "total_sprints": insights_consolidados["total_sprints"],
+            "total_itens": insights_consolidados["total_itens"],
+            "total_esforco": insights_consolidados["total_esforco"],
+            "media_percentual_concluido": f"{insights_consolidados['media_percentual_concluido']:.1f}",
+            "media_itens_sprint": f"{insights_consolidados['media_itens_sprint']:.1f}",
+            "media_esforco_sprint": f"{insights_consolidados['media_esforco_sprint']:.1f}",
+            "media_retornos_por_sprint": f"{insights_consolidados['media_retornos_por_sprint']:.1f}",
+            "total_chamados": total_chamados,
+            "chamados_concluidos": chamados_concluidos,
+            "percentual_chamados": f"{percentual_chamados:.1f}",
+            "grafico_tendencia_conclusao": graficos_tendencia_html.get(
+                "tendencia_conclusao", _GRAFICO_INDISPONIVEL
+            ),
+            "grafico_tendencia_esforco": graficos_tendencia_html.get(
+                "tendencia_esforco", _GRAFICO_INDISPONIVEL
+            ),
+            "tabela_comparativa_sprints": self._gerar_tabela_comparativa_sprints(
+                nomes_sprints, insights_consolidados
+            ),
+            "sprint_sections": sprint_sections_html,
+            "gerado_em": gerado_em,
+        }
+
+    def _gerar_graficos_tendencia_plotly(self, insights_consolidados):
+        """
+        Gera gráficos de tendência Plotly ao longo das sprints.
+
+        Parameters
+        ----------
+        insights_consolidados : dict
+            Dados consolidados das sprints
+
+        Returns
+        -------
+        dict
+            Dicionário com objetos Plotly
+        """
+        import plotly.graph_objects as go
+
+        graficos = {}
+
+        # Gráfico combinado de tendência de conclusão e esforço
+        if (
+            insights_consolidados["tendencia_conclusao"]
+            and insights_consolidados["tendencia_esforco"]
+        ):
+            # Extrações fundidas via itemgetter: uma passada por lista
+            # em vez de uma list comprehension por campo
+            sprints_conclusao, percentuais = zip(
+                *map(
+                    itemgetter("sprint", "percentual"),
+                    insights_consolidados["tendencia_conclusao"],
+                )
+            )
+            sprints_esforco, esforcos = zip(
+                *map(
+                    itemgetter("sprint", "esforco"),
+                    insights_consolidados["tendencia_esforco"],
+                )
+            )
+
+            # Verificar se as listas de sprints são iguais
+            if sprints_conclusao == sprints_esforco:
+                sprints = sprints_conclusao
+
+                # Criar figura com dois eixos Y. Traces e layout vão
+                # direto no construtor: cada add_trace/update_layout
+                # revalidaria o dicionário inteiro da figura
+                fig = go.Figure(
+                    data=[
+                        go.Scatter(
+                            x=sprints,
+                            y=percentuais,
+                            mode="lines+markers",
+                            name="Taxa de Conclusão (%)",
+                            marker=dict(color="#0078d4", size=10),
+                            line=dict(color="#0078d4", width=2),
+                        ),
+                        go.Scatter(
+                            x=sprints,
+                            y=esforcos,
+                            mode="lines+markers",
+                            name="Esforço Total (pontos)",
+                            marker=dict(color="#27ae60", size=10),
+                            line=dict(color="#27ae60", width=2),
+                            yaxis="y2",
+                        ),
+                    ],
+                    layout=go.Layout(
+                        title="Tendência de Conclusão e Esforço por Sprint",
+                        xaxis=dict(
+                            title=dict(text="Sprint", font=dict(color="#333333")),
+                            tickfont=dict(color="#333333"),
+                        ),
+                        yaxis=dict(
+                            title=dict(
+                                text="Taxa de Conclusão (%)", font=dict(color="#0078d4")
+                            ),
+                            tickfont=dict(color="#0078d4"),
+                            side="left",
+                        ),
+                        yaxis2=dict(
+                            title=dict(
+                                text="Pontos de Esforço", font=dict(color="#27ae60")
+                            ),
+                            tickfont=dict(color="#27ae60"),
+                            overlaying="y",
+                            side="right",
+                        ),
+                        height=500,
+                        template="plotly_white",
+                        legend=dict(
+                            orientation="h",
+                            yanchor="bottom",
+                            y=1.02,
+                            xanchor="center",
+                            x=0.5,
+                        ),
+                        margin=dict(l=60, r=60, t=80, b=60),
+                    ),
+                )
+
+                graficos["tendencia_combinada"] = fig
+            else:
+                # Se as listas de sprints não forem iguais, criar gráficos separados
+                logger.warning(
+                    "As listas de sprints para conclusão e esforço são diferentes. Criando gráficos separados."
+                )
+
+                # Gráfico de tendência de conclusão
+                fig_conclusao = go.Figure(
+                    data=[
+                        go.Scatter(
+                            x=sprints_conclusao,
+                            y=percentuais,
+                            mode="lines+markers",
+                            name="Taxa de Conclusão",
+                            marker=dict(color="#0078d4", size=10),
+                            line=dict(color="#0078d4", width=2),
+                        )
+                    ],
+                    layout=go.Layout(
+                        title="Tendência de Conclusão por Sprint",
+                        xaxis_title="Sprint",
+                        yaxis_title="Percentual de Conclusão (%)",
+                        height=500,
+                        template="plotly_white",
+                    ),
+                )
+                graficos["tendencia_conclusao"] = fig_conclusao
+
+                # Gráfico de tendência de esforço
+                fig_esforco = go.Figure(
+                    data=[
+                        go.Scatter(
+                            x=sprints_esforco,
+                            y=esforcos,
+                            mode="lines+markers",
+                            name="Esforço Total",
+                            marker=dict(color="#27ae60", size=10),
+                            line=dict(color="#27ae60", width=2),
+                        )
+                    ],
+                    layout=go.Layout(
+                        title="Tendência de Esforço por Sprint",
+                        xaxis_title="Sprint",
+                        yaxis_title="Pontos de Esforço",
+                        height=500,
+                        template="plotly_white",
+                    ),
+                )
+                graficos["tendencia_esforco"] = fig_esforco
+
+        return graficos
+
+    def _gerar_html_consolidado_com_plotly(
+        self,
+        nomes_sprints,
+        insights_consolidados,
+        graficos_tendencia,
+        graficos_por_sprint,
+        estatico=False,
+    ):
+        """
+        Gera HTML consolidado com gráficos Plotly embutidos.
+
+        Parameters
+        ----------
+        nomes_sprints : list
+            Lista de nomes das sprints
+        insights_consolidados : dict
+            Insights consolidados
+        graficos_tendencia : dict
+            Gráficos de tendência Plotly
+        graficos_por_sprint : dict
+            Dicionário com gráficos Plotly por sprint
+        estatico : bool, optional
+            Quando True, embute as figuras como SVG inline (via
+            kaleido) em vez de gráficos interativos — indicado para
+            consumo em impressão/PDF, sem JS nem plotly.min.js
+
+        Returns
+        -------
+        str
+            HTML gerado
         """
+        # Converte os gráficos de tendência para fragmentos mínimos
+        # (o plotly.min.js é embutido uma única vez no <head>)
+        if estatico:
+            graficos_tendencia_html = {
+                nome: self._fig_para_svg(fig)
+                for nome, fig in graficos_tendencia.items()
+            }
+        else:
+            graficos_tendencia_html = {
+                nome: self._fig_para_html(fig, f"grafico_{nome}")
+                for nome, fig in graficos_tendencia.items()
+            }
+
+        # Cria HTML para o dropdown das sprints e seus gráficos. A
+        # seção de cada sprint é memoizada por (nome, hash dos dados
+        # consolidados da sprint): ao regenerar relatórios com sprints
+        # repetidas, a serialização das figuras é pulada inteiramente
+        por_sprint = insights_consolidados.get("por_sprint", {})
+        secoes_sprints = []
+        for sprint in nomes_sprints:
+            chave_secao = hashlib.blake2b(
+                repr(
+                    (sprint, estatico, sorted((por_sprint.get(sprint) or {}).items()))
+                ).encode("utf-8"),
+                digest_size=16,
+            ).hexdigest()
+            secao_cacheada = self._cache_secoes_sprint.get(chave_secao)
+            if secao_cacheada is not None:
+                secoes_sprints.append(secao_cacheada)
+                continue
+
+            figs_sprint = graficos_por_sprint.get(sprint, {})
+            if estatico:
+                # kaleido libera o GIL durante o IPC com o renderizador,
+                # então as conversões para SVG paralelizam bem em threads
+                with ThreadPoolExecutor(max_workers=4) as executor:
+                    svgs = list(executor.map(self._fig_para_svg, figs_sprint.values()))
+                graphs = dict(zip(figs_sprint.keys(), svgs))
+            else:
+                graphs = {}
+                id_sprint = re.sub(r"\W+", "_", sprint)
+                for nome, fig in figs_sprint.items():
+                    try:
+                        graphs[nome] = self._fig_para_html_preguicoso(
+                            fig, f"grafico_{id_sprint}_{nome}"
+                        )
+                    except Exception as e:
+                        logger.error(
+                            f"Erro ao converter gráfico {nome} da sprint {sprint}: {str(e)}"
+                        )
+                        graphs[nome] = f"<div>Erro ao gerar gráfico: {nome}</div>"
+
+            sprint_section = _TEMPLATE_SECAO_SPRINT_COMPLETA.substitute(
+                sprint=sprint,
+                itens_por_tipo=graphs.get("itens_por_tipo", _GRAFICO_INDISPONIVEL),
+                itens_por_estado=graphs.get("itens_por_estado", _GRAFICO_INDISPONIVEL),
+                itens_por_responsavel=graphs.get(
+                    "itens_por_responsavel", _GRAFICO_INDISPONIVEL
+                ),
+                esforco_por_responsavel=graphs.get(
+                    "esforco_por_responsavel", _GRAFICO_INDISPONIVEL
+                ),
+                tempo_medio_coluna=graphs.get(
+                    "tempo_medio_coluna", _GRAFICO_INDISPONIVEL
+                ),
+                adicoes_meio_sprint=graphs.get(
+                    "adicoes_meio_sprint", _GRAFICO_INDISPONIVEL
+                ),
+                retornos=graphs.get("retornos", _GRAFICO_INDISPONIVEL),
+            )
+            # Limite simples para o cache não crescer sem controle
+            if len(self._cache_secoes_sprint) >= 64:
+                self._cache_secoes_sprint.pop(next(iter(self._cache_secoes_sprint)))
+            self._cache_secoes_sprint[chave_secao] = sprint_section
+            secoes_sprints.append(sprint_section)
+
+        sprint_sections_html = "".join(secoes_sprints)
+
+        # Valores com fallback resolvidos uma única vez
+        total_chamados = insights_consolidados.get("total_chamados", 0)
+        chamados_concluidos = insights_consolidados.get("chamados_concluidos", 0)
+        percentual_chamados = (
+            chamados_concluidos / total_chamados * 100 if total_chamados > 0 else 0
+        )
 
-        return html
+        # Gera o HTML completo a partir do template de módulo
+        return _TEMPLATE_RELATORIO_CONSOLIDADO_COMPLETO.substitute(
+            script_plotly="" if estatico else _script_plotly_inline(),
+            sprints_lista=", ".join(nomes_sprints),
+            total_sprints=insights_consolidados["total_sprints"],
+            total_itens=insights_consolidados["total_itens"],
+            total_esforco=insights_consolidados["total_esforco"],
+            media_percentual_concluido=f"{insights_consolidados['media_percentual_concluido']:.1f}",
+            media_itens_sprint=f"{insights_consolidados['media_itens_sprint']:.1f}",
+            media_esforco_sprint=f"{insights_consolidados['media_esforco_sprint']:.1f}",
+            media_retornos_por_sprint=f"{insights_consolidados['media_retornos_por_sprint']:.1f}",
+            total_chamados=total_chamados,
+            chamados_concluidos=chamados_concluidos,
+            percentual_chamados=f"{percentual_chamados:.1f}",
+            grafico_tendencia_conclusao=graficos_tendencia_html.get(
+                "tendencia_conclusao", _GRAFICO_INDISPONIVEL
+            ),
+            grafico_tendencia_esforco=graficos_tendencia_html.get(
+                "tendencia_esforco", _GRAFICO_INDISPONIVEL
+            ),
+            tabela_comparativa_sprints=self._gerar_tabela_comparativa_sprints(
+                nomes_sprints, insights_consolidados
+            ),
+            sprint_sections=sprint_sections_html,
+            gerado_em=datetime.now().strftime("%d/%m/%Y %H:%M:%S"),
+        )
 
-    def _gerar_linhas_tabela_sprints(self, nomes_sprints, insights_consolidados):
+    def _gerar_tabela_comparativa_sprints(self, nomes_sprints, insights_consolidados):
         """
-        Gera as linhas da tabela comparativa entre sprints.
+        Gera a tabela comparativa entre sprints via pandas.
+
+        ``DataFrame.to_html`` formata todas as linhas em uma única
+        chamada vetorizada, em vez de um loop Python por sprint.
 
         Parameters
         ----------
@@ -1363,27 +2008,35 @@ class ReportGenerator:
         Returns
         -------
         str
-            HTML com as linhas da tabela
+            HTML com a tabela comparativa completa
         """
-        linhas_html = ""
+        import pandas as pd
 
-        for sprint in nomes_sprints:
-            if sprint in insights_consolidados["por_sprint"]:
-                dados_sprint = insights_consolidados["por_sprint"][sprint]
-
-                linha = f"""
-                <tr>
-                    <td>{sprint}</td>
-                    <td>{dados_sprint["total_itens"]}</td>
-                    <td>{dados_sprint["esforco_total"]}</td>
-                    <td>{dados_sprint["percentual_concluido"]:.1f}%</td>
-                    <td>{dados_sprint.get("total_chamados", 0)}</td>
-                    <td>{dados_sprint["retornos"]}</td>
-                </tr>
-                """
-                linhas_html += linha
-
-        return linhas_html
+        por_sprint = insights_consolidados["por_sprint"]
+        nomes = [sprint for sprint in nomes_sprints if sprint in por_sprint]
+        if not nomes:
+            return '<table class="sprint-compare"></table>'
+
+        df = pd.DataFrame([por_sprint[sprint] for sprint in nomes])
+        if "total_chamados" not in df.columns:
+            df["total_chamados"] = 0
+
+        df["percentual_concluido"] = df["percentual_concluido"].map(
+            "{:.1f}%".format
+        )
+
+        tabela = pd.DataFrame(
+            {
+                "Sprint": nomes,
+                "Itens": df["total_itens"].values,
+                "Esforço": df["esforco_total"].values,
+                "Taxa de Conclusão": df["percentual_concluido"].values,
+                "Chamados": df["total_chamados"].fillna(0).values,
+                "Retornos": df["retornos"].values,
+            }
+        )
+
+        return tabela.to_html(index=False, border=0, classes="sprint-compare")
 
     # Métodos para gerar gráficos Plotly individuais
     def gerar_graficos_plotly(self, dados_processados, nome_sprint):
@@ -1402,369 +2055,386 @@ class ReportGenerator:
         dict
             Dicionário com objetos de figura do Plotly
         """
+        # Reaproveita as figuras quando o Streamlit redesenha a página
+        # com os mesmos dados: as figuras geradas aqui são apenas
+        # serializadas pelos consumidores, nunca mutadas, então é
+        # seguro devolver os mesmos objetos
+        chave_figuras = hashlib.blake2b(
+            repr((nome_sprint, dados_processados)).encode("utf-8"), digest_size=16
+        ).hexdigest()
+        graficos_cacheados = self._cache_graficos.get(chave_figuras)
+        if graficos_cacheados is not None:
+            return graficos_cacheados
+
         graficos = {}
 
+        # Todos os agregados saem de uma única passada sobre os dados;
+        # cada gráfico recebe sua série/contagem já pronta
+        agregados = self._precomputar_agregados(dados_processados)
+
         # Gráfico de itens por tipo
         graficos["itens_por_tipo"] = self._gerar_grafico_plotly_itens_por_tipo(
-            dados_processados, nome_sprint
+            agregados["contagens_tipo"], nome_sprint
         )
 
         # Gráfico de itens por estado
         graficos["itens_por_estado"] = self._gerar_grafico_plotly_itens_por_estado(
-            dados_processados, nome_sprint
+            agregados["contagens_estado"], nome_sprint
         )
 
         # Gráficos de carga de trabalho
         graficos["itens_por_responsavel"] = (
             self._gerar_grafico_plotly_itens_por_responsavel(
-                dados_processados, nome_sprint
+                agregados["contagens_responsavel"], nome_sprint
             )
         )
 
         graficos["esforco_por_responsavel"] = (
             self._gerar_grafico_plotly_esforco_por_responsavel(
-                dados_processados, nome_sprint
+                agregados["esforco_por_responsavel"], nome_sprint
             )
         )
 
         # Tempo médio em coluna
         graficos["tempo_medio_coluna"] = self._gerar_grafico_plotly_tempo_medio_coluna(
-            dados_processados, nome_sprint
+            agregados["tempos_medios_coluna"], nome_sprint
         )
 
         # Adições no meio da sprint
         graficos["adicoes_meio_sprint"] = self._gerar_grafico_plotly_adicoes_sprint(
-            dados_processados, nome_sprint
+            agregados["total_itens"], agregados["adicoes_meio_sprint"], nome_sprint
         )
 
         # Retornos
-        if any(item["retornos"] for item in dados_processados):
+        if agregados["contagens_retorno"]:
             graficos["retornos"] = self._gerar_grafico_plotly_retornos(
-                dados_processados, nome_sprint
+                agregados["contagens_retorno"], nome_sprint
             )
 
+        # Limite simples para o cache não crescer sem controle
+        if len(self._cache_graficos) >= 16:
+            self._cache_graficos.pop(next(iter(self._cache_graficos)))
+        self._cache_graficos[chave_figuras] = graficos
+
         return graficos
 
-    def _gerar_grafico_plotly_itens_por_tipo(self, dados_processados, nome_sprint):
-        """Gera gráfico Plotly de itens por tipo."""
-        try:
-            # Calcula contagens
-            contagens_tipo = {}
-            for item in dados_processados:
-                tipo_item = item["tipo"]
-                if tipo_item not in contagens_tipo:
-                    contagens_tipo[tipo_item] = 0
-                contagens_tipo[tipo_item] += 1
-
-            # Prepara dados para Plotly
-            df = pd.DataFrame(
-                {
-                    "Tipo": list(contagens_tipo.keys()),
-                    "Quantidade": list(contagens_tipo.values()),
-                }
-            )
+    def _precomputar_agregados(self, dados_processados):
+        """
+        Calcula os agregados de todos os gráficos em uma única passada.
+
+        As contagens categóricas saem vetorizadas de um DataFrame
+        construído uma vez; tempos por coluna, adições e retornos são
+        coletados em um único loop Python sobre os itens, em vez de
+        uma iteração separada por gráfico.
+
+        Parameters
+        ----------
+        dados_processados : list
+            Lista de itens processados
+
+        Returns
+        -------
+        dict
+            Séries e contagens prontas para os construtores de gráfico
+        """
+        import pandas as pd
 
-            # Ordena por quantidade
-            df = df.sort_values("Quantidade", ascending=False)
+        df_itens = pd.DataFrame(dados_processados)
 
-            # Cria o gráfico
-            fig = px.bar(
-                df,
-                x="Tipo",
-                y="Quantidade",
-                color="Tipo",
-                title=f"Itens de Trabalho por Tipo - {nome_sprint}",
+        if df_itens.empty:
+            serie_vazia = pd.Series(dtype="int64")
+            contagens_tipo = serie_vazia
+            contagens_estado = serie_vazia
+            contagens_responsavel = serie_vazia
+            esforco_por_responsavel = serie_vazia
+        else:
+            contagens_tipo = df_itens["tipo"].value_counts()
+            # sort=False preserva a ordem de aparição dos estados
+            contagens_estado = df_itens["estado"].value_counts(sort=False)
+            contagens_responsavel = df_itens["responsavel_atual"].value_counts()
+            esforco_por_responsavel = (
+                df_itens.groupby("responsavel_atual")["esforco"]
+                .sum()
+                .sort_values(ascending=False)
+            )
+
+        registros_tempo = []
+        adicoes_meio_sprint = 0
+        contagens_retorno = Counter()
+
+        for item in dados_processados:
+            if item.get("adicionado_meio_sprint", False):
+                adicoes_meio_sprint += 1
+
+            for retorno in item.get("retornos") or []:
+                contagens_retorno[f"{retorno['de']} -> {retorno['para']}"] += 1
+
+            for coluna, transicoes in item.get("transicoes_coluna", {}).items():
+                if len(transicoes) >= 2:
+                    registros_tempo.append((coluna, transicoes[0], transicoes[-1]))
+
+        # Timestamps analisados em duas chamadas vetorizadas de
+        # pd.to_datetime (que entende o sufixo "Z" nativamente), em vez
+        # de datetime.fromisoformat por item; a média por coluna sai de
+        # um groupby, reindexado para cobrir colunas sem registros
+        colunas_estados = list(self.sprint_analyzer.colunas_estados)
+        if registros_tempo:
+            df_tempos = pd.DataFrame(
+                registros_tempo, columns=["coluna", "primeira", "ultima"]
+            )
+            horas = (
+                pd.to_datetime(df_tempos["ultima"], utc=True)
+                - pd.to_datetime(df_tempos["primeira"], utc=True)
+            ).dt.total_seconds() / 3600
+            tempos_medios_coluna = (
+                horas.groupby(df_tempos["coluna"])
+                .mean()
+                .reindex(colunas_estados, fill_value=0)
+                .to_dict()
             )
+        else:
+            tempos_medios_coluna = {coluna: 0 for coluna in colunas_estados}
+
+        return {
+            "contagens_tipo": contagens_tipo,
+            "contagens_estado": contagens_estado,
+            "contagens_responsavel": contagens_responsavel,
+            "esforco_por_responsavel": esforco_por_responsavel,
+            "tempos_medios_coluna": tempos_medios_coluna,
+            "total_itens": len(dados_processados),
+            "adicoes_meio_sprint": adicoes_meio_sprint,
+            "contagens_retorno": contagens_retorno,
+        }
+
+    def _gerar_grafico_barras(
+        self, categorias, valores, titulo, rotulo_x, rotulo_y, altura=400
+    ):
+        """
+        Caminho único de construção dos gráficos de barra.
+
+        Concentra o go.Figure/go.Layout repetido pelos helpers; cada
+        chamador só prepara as categorias e os valores já agregados.
 
-            # Personaliza o layout
-            fig.update_layout(
-                xaxis_title="Tipo de Item",
-                yaxis_title="Quantidade",
-                height=400,
+        Parameters
+        ----------
+        categorias : sequence
+            Rótulos do eixo X
+        valores : sequence
+            Valores do eixo Y, na mesma ordem
+        titulo : str
+            Título do gráfico
+        rotulo_x : str
+            Rótulo do eixo X
+        rotulo_y : str
+            Rótulo do eixo Y
+        altura : int, optional
+            Altura do gráfico em pixels
+
+        Returns
+        -------
+        plotly.graph_objects.Figure
+            Figura gerada
+        """
+        import plotly.graph_objects as go
+
+        return go.Figure(
+            data=[
+                go.Bar(
+                    x=categorias,
+                    y=valores,
+                    marker_color=_cores_categorias(len(categorias)),
+                )
+            ],
+            layout=go.Layout(
+                title=titulo,
+                xaxis_title=rotulo_x,
+                yaxis_title=rotulo_y,
+                height=altura,
                 showlegend=False,
                 template="plotly_white",
-            )
+            ),
+        )
 
-            return fig
+    def _gerar_grafico_plotly_itens_por_tipo(self, contagens_tipo, nome_sprint):
+        """Gera gráfico Plotly de itens por tipo."""
+        import plotly.graph_objects as go
+
+        # Sprint vazia: evita montar e validar uma figura à toa
+        if contagens_tipo.empty:
+            return go.Figure()
+
+        try:
+            # Contagem pré-calculada em _precomputar_agregados
+            return self._gerar_grafico_barras(
+                contagens_tipo.index,
+                contagens_tipo.values,
+                f"Itens de Trabalho por Tipo - {nome_sprint}",
+                "Tipo de Item",
+                "Quantidade",
+            )
         except Exception as e:
             logger.error(f"Erro ao gerar gráfico de itens por tipo: {str(e)}")
             return go.Figure()
 
-    def _gerar_grafico_plotly_itens_por_estado(self, dados_processados, nome_sprint):
+    def _gerar_grafico_plotly_itens_por_estado(self, contagens_estado, nome_sprint):
         """Gera gráfico Plotly de itens por estado atual."""
-        try:
-            # Calcula contagens
-            contagens_estado = {}
-            for item in dados_processados:
-                estado = item["estado"]
-                if estado not in contagens_estado:
-                    contagens_estado[estado] = 0
-                contagens_estado[estado] += 1
-
-            # Prepara dados para Plotly
-            df = pd.DataFrame(
-                {
-                    "Estado": list(contagens_estado.keys()),
-                    "Quantidade": list(contagens_estado.values()),
-                }
-            )
+        import plotly.graph_objects as go
 
-            # Cria o gráfico
-            fig = px.bar(
-                df,
-                x="Estado",
-                y="Quantidade",
-                color="Estado",
-                title=f"Itens de Trabalho por Estado Atual - {nome_sprint}",
-            )
+        if contagens_estado.empty:
+            return go.Figure()
 
-            # Personaliza o layout
-            fig.update_layout(
-                xaxis_title="Estado",
-                yaxis_title="Quantidade",
-                height=400,
-                showlegend=False,
-                template="plotly_white",
+        try:
+            # Contagem pré-calculada em _precomputar_agregados
+            return self._gerar_grafico_barras(
+                contagens_estado.index,
+                contagens_estado.values,
+                f"Itens de Trabalho por Estado Atual - {nome_sprint}",
+                "Estado",
+                "Quantidade",
             )
-
-            return fig
         except Exception as e:
             logger.error(f"Erro ao gerar gráfico de itens por estado: {str(e)}")
             return go.Figure()
 
+    def _gerar_barra_por_responsavel(self, serie, rotulo_y, titulo):
+        """
+        Constrói um gráfico de barras por responsável.
+
+        Caminho compartilhado entre os gráficos de contagem e de
+        esforço: aplica o corte top-10 + "Outros" sobre a série
+        agregada (já ordenada decrescente) e monta o go.Bar.
+
+        Parameters
+        ----------
+        serie : pandas.Series
+            Valores agregados por responsável, em ordem decrescente
+        rotulo_y : str
+            Rótulo do eixo Y
+        titulo : str
+            Título do gráfico
+
+        Returns
+        -------
+        plotly.graph_objects.Figure
+            Figura gerada
+        """
+        import plotly.graph_objects as go
+
+        if serie.empty:
+            return go.Figure()
+
+        nomes = list(serie.index)
+        valores = list(serie.values)
+
+        # Limita para os top 10 responsáveis se houver muitos
+        if len(nomes) > 10:
+            nomes = nomes[:10] + ["Outros"]
+            valores = valores[:10] + [sum(valores[10:])]
+
+        return self._gerar_grafico_barras(
+            nomes, valores, titulo, "Responsável", rotulo_y
+        )
+
     def _gerar_grafico_plotly_itens_por_responsavel(
-        self, dados_processados, nome_sprint
+        self, contagens_responsavel, nome_sprint
     ):
         """Gera gráfico Plotly de itens por responsável."""
-        try:
-            # Calcula contagens
-            contagens_responsavel = {}
-            for item in dados_processados:
-                responsavel = item["responsavel_atual"]
-                if responsavel not in contagens_responsavel:
-                    contagens_responsavel[responsavel] = 0
-                contagens_responsavel[responsavel] += 1
-
-            # Prepara dados para Plotly
-            df = pd.DataFrame(
-                {
-                    "Responsável": list(contagens_responsavel.keys()),
-                    "Quantidade": list(contagens_responsavel.values()),
-                }
-            )
-
-            # Ordena por quantidade
-            df = df.sort_values("Quantidade", ascending=False)
-
-            # Limita para os top 10 responsáveis se houver muitos
-            if len(df) > 10:
-                outros_total = df.iloc[10:]["Quantidade"].sum()
-                df = df.iloc[:10].copy()
-                df = pd.concat(
-                    [
-                        df,
-                        pd.DataFrame(
-                            {"Responsável": ["Outros"], "Quantidade": [outros_total]}
-                        ),
-                    ]
-                )
+        import plotly.graph_objects as go
 
-            # Cria o gráfico
-            fig = px.bar(
-                df,
-                x="Responsável",
-                y="Quantidade",
-                color="Responsável",
-                title=f"Itens de Trabalho por Responsável - {nome_sprint}",
-            )
-
-            # Personaliza o layout
-            fig.update_layout(
-                xaxis_title="Responsável",
-                yaxis_title="Quantidade de Itens",
-                height=400,
-                showlegend=False,
-                template="plotly_white",
+        try:
+            # Contagem pré-calculada em _precomputar_agregados
+            return self._gerar_barra_por_responsavel(
+                contagens_responsavel,
+                "Quantidade de Itens",
+                f"Itens de Trabalho por Responsável - {nome_sprint}",
             )
-
-            return fig
         except Exception as e:
             logger.error(f"Erro ao gerar gráfico de itens por responsável: {str(e)}")
             return go.Figure()
 
     def _gerar_grafico_plotly_esforco_por_responsavel(
-        self, dados_processados, nome_sprint
+        self, esforco_por_responsavel, nome_sprint
     ):
         """Gera gráfico Plotly de esforço por responsável."""
-        try:
-            # Calcula esforço
-            esforco_responsavel = {}
-            for item in dados_processados:
-                responsavel = item["responsavel_atual"]
-                if responsavel not in esforco_responsavel:
-                    esforco_responsavel[responsavel] = 0
-                esforco_responsavel[responsavel] += item["esforco"] or 0
-
-            # Prepara dados para Plotly
-            df = pd.DataFrame(
-                {
-                    "Responsável": list(esforco_responsavel.keys()),
-                    "Esforço": list(esforco_responsavel.values()),
-                }
-            )
-
-            # Ordena por esforço
-            df = df.sort_values("Esforço", ascending=False)
-
-            # Limita para os top 10 responsáveis se houver muitos
-            if len(df) > 10:
-                outros_total = df.iloc[10:]["Esforço"].sum()
-                df = df.iloc[:10].copy()
-                df = pd.concat(
-                    [
-                        df,
-                        pd.DataFrame(
-                            {"Responsável": ["Outros"], "Esforço": [outros_total]}
-                        ),
-                    ]
-                )
-
-            # Cria o gráfico
-            fig = px.bar(
-                df,
-                x="Responsável",
-                y="Esforço",
-                color="Responsável",
-                title=f"Esforço por Responsável - {nome_sprint}",
-            )
+        import plotly.graph_objects as go
 
-            # Personaliza o layout
-            fig.update_layout(
-                xaxis_title="Responsável",
-                yaxis_title="Pontos de Esforço",
-                height=400,
-                showlegend=False,
-                template="plotly_white",
+        try:
+            # Soma pré-calculada em _precomputar_agregados
+            return self._gerar_barra_por_responsavel(
+                esforco_por_responsavel,
+                "Pontos de Esforço",
+                f"Esforço por Responsável - {nome_sprint}",
             )
-
-            return fig
         except Exception as e:
             logger.error(f"Erro ao gerar gráfico de esforço por responsável: {str(e)}")
             return go.Figure()
 
-    def _gerar_grafico_plotly_tempo_medio_coluna(self, dados_processados, nome_sprint):
+    def _gerar_grafico_plotly_tempo_medio_coluna(
+        self, tempos_medios_coluna, nome_sprint
+    ):
         """Gera gráfico Plotly de tempo médio em cada coluna."""
-        try:
-            # Calcula tempo médio por coluna
-            tempos_medios_coluna = {}
-            for coluna in self.sprint_analyzer.colunas_estados.keys():
-                tempos_coluna = []
-
-                for item in dados_processados:
-                    transicoes = item.get("transicoes_coluna", {}).get(coluna, [])
-                    if len(transicoes) >= 2:
-                        primeira = datetime.fromisoformat(
-                            transicoes[0].replace("Z", "+00:00")
-                        )
-                        ultima = datetime.fromisoformat(
-                            transicoes[-1].replace("Z", "+00:00")
-                        )
-                        horas = (ultima - primeira).total_seconds() / 3600
-                        tempos_coluna.append(horas)
-
-                if tempos_coluna:
-                    tempos_medios_coluna[coluna] = sum(tempos_coluna) / len(
-                        tempos_coluna
-                    )
-                else:
-                    tempos_medios_coluna[coluna] = 0
-
-            # Prepara dados para Plotly
-            df = pd.DataFrame(
-                {
-                    "Coluna": list(tempos_medios_coluna.keys()),
-                    "Horas": list(tempos_medios_coluna.values()),
-                }
-            )
+        import plotly.graph_objects as go
 
-            # Cria o gráfico
-            fig = px.bar(
-                df,
-                x="Coluna",
-                y="Horas",
-                color="Coluna",
-                title=f"Tempo Médio em Coluna (Horas) - {nome_sprint}",
-            )
+        if not tempos_medios_coluna:
+            return go.Figure()
 
-            # Personaliza o layout
-            fig.update_layout(
-                xaxis_title="Coluna",
-                yaxis_title="Horas",
-                height=400,
-                showlegend=False,
-                template="plotly_white",
+        try:
+            # Médias pré-calculadas em _precomputar_agregados
+            return self._gerar_grafico_barras(
+                list(tempos_medios_coluna.keys()),
+                list(tempos_medios_coluna.values()),
+                f"Tempo Médio em Coluna (Horas) - {nome_sprint}",
+                "Coluna",
+                "Horas",
             )
-
-            return fig
         except Exception as e:
             logger.error(f"Erro ao gerar gráfico de tempo médio em coluna: {str(e)}")
             return go.Figure()
 
-    def _gerar_grafico_plotly_adicoes_sprint(self, dados_processados, nome_sprint):
+    def _gerar_grafico_plotly_adicoes_sprint(
+        self, total_itens, contagem_meio_sprint, nome_sprint
+    ):
         """Gera gráfico Plotly de adições no meio da sprint."""
-        try:
-            # Calcula contagens
-            contagem_meio_sprint = sum(
-                1
-                for item in dados_processados
-                if item.get("adicionado_meio_sprint", False)
-            )
-            contagem_inicial = len(dados_processados) - contagem_meio_sprint
-
-            # Prepara dados para Plotly
-            df = pd.DataFrame(
-                {
-                    "Tipo": ["Itens Iniciais", "Adicionados no Meio da Sprint"],
-                    "Quantidade": [contagem_inicial, contagem_meio_sprint],
-                }
-            )
+        import plotly.graph_objects as go
 
-            # Cria o gráfico
-            fig = px.pie(
-                df,
-                values="Quantidade",
-                names="Tipo",
-                title=f"Itens Iniciais vs. Adições no Meio da Sprint - {nome_sprint}",
-                color="Tipo",
-                color_discrete_map={
-                    "Itens Iniciais": "#0078d4",
-                    "Adicionados no Meio da Sprint": "#ff8c00",
-                },
-            )
+        if not total_itens:
+            return go.Figure()
 
-            # Personaliza o layout para melhorar a posição da legenda
-            fig.update_layout(
-                height=400,
-                template="plotly_white",
-                # Mover a legenda para dentro do gráfico
-                legend=dict(
-                    orientation="v",  # Legenda horizontal
-                    yanchor="bottom",  # Ancorada na parte inferior
-                    y=-0.2,  # Posicionada abaixo do gráfico
-                    xanchor="center",  # Centralizada
-                    x=0.5,  # No meio horizontalmente
-                    font=dict(size=10),  # Texto menor para evitar corte
+        try:
+            # Contagem pré-calculada em _precomputar_agregados
+            contagem_inicial = total_itens - contagem_meio_sprint
+
+            # go.Pie com estilo dos traces e layout direto no
+            # construtor, sem o mapeamento de cores do Plotly Express;
+            # a legenda fica abaixo do gráfico para evitar corte
+            fig = go.Figure(
+                data=[
+                    go.Pie(
+                        labels=["Itens Iniciais", "Adicionados no Meio da Sprint"],
+                        values=[contagem_inicial, contagem_meio_sprint],
+                        marker=dict(colors=["#0078d4", "#ff8c00"]),
+                        textposition="inside",
+                        textinfo="percent+label",
+                        insidetextorientation="radial",
+                    )
+                ],
+                layout=go.Layout(
+                    title=(
+                        "Itens Iniciais vs. Adições no Meio da Sprint"
+                        f" - {nome_sprint}"
+                    ),
+                    height=400,
+                    template="plotly_white",
+                    legend=dict(
+                        orientation="v",
+                        yanchor="bottom",
+                        y=-0.2,
+                        xanchor="center",
+                        x=0.5,
+                        font=dict(size=10),
+                    ),
+                    margin=dict(t=50, b=80, l=20, r=20),
                 ),
-                margin=dict(
-                    t=50, b=80, l=20, r=20
-                ),  # Maior margem inferior para acomodar a legenda
-            )
-
-            # Ajustar o layout do gráfico em si
-            fig.update_traces(
-                textposition="inside",  # Texto dentro das fatias
-                textinfo="percent+label",  # Mostra percentual e rótulo
-                insidetextorientation="radial",  # Orientação do texto
             )
 
             return fig
@@ -1774,52 +2444,38 @@ class ReportGenerator:
             )
             return go.Figure()
 
-    def _gerar_grafico_plotly_retornos(self, dados_processados, nome_sprint):
+    def _gerar_grafico_plotly_retornos(self, contagens_retorno, nome_sprint):
         """Gera gráfico Plotly de retornos entre estados."""
-        try:
-            # Calcula contagens de retornos por transição
-            contagens_retorno = {}
-            for item in dados_processados:
-                for retorno in item.get("retornos", []):
-                    transicao = f"{retorno['de']} -> {retorno['para']}"
-                    if transicao not in contagens_retorno:
-                        contagens_retorno[transicao] = 0
-                    contagens_retorno[transicao] += 1
+        import plotly.graph_objects as go
 
+        try:
+            # Contagens pré-calculadas em _precomputar_agregados
             # Se não há retornos, retornar uma figura vazia
             if not contagens_retorno:
                 return go.Figure()
 
-            # Prepara dados para Plotly
-            df = pd.DataFrame(
-                {
-                    "Transição": list(contagens_retorno.keys()),
-                    "Quantidade": list(contagens_retorno.values()),
-                }
-            )
-
-            # Ordena por quantidade
-            df = df.sort_values("Quantidade", ascending=False)
-
-            # Cria o gráfico
-            fig = px.bar(
-                df,
-                x="Transição",
-                y="Quantidade",
-                color="Transição",
-                title=f"Retornos por Transição - {nome_sprint}",
+            # Ordena por quantidade e alimenta o go.Bar direto das
+            # tuplas, sem DataFrame intermediário
+            pares = sorted(
+                contagens_retorno.items(), key=itemgetter(1), reverse=True
             )
 
-            # Personaliza o layout
-            fig.update_layout(
-                xaxis_title="Transição",
-                yaxis_title="Quantidade",
-                height=500,
-                showlegend=False,
-                template="plotly_white",
+            # Limita a cardinalidade do eixo: com dezenas de transições
+            # distintas o gráfico fica ilegível e caro de renderizar
+            if len(pares) > 20:
+                outros = sum(quantidade for _, quantidade in pares[20:])
+                pares = pares[:20] + [("Outros", outros)]
+
+            transicoes, quantidades = zip(*pares)
+
+            return self._gerar_grafico_barras(
+                transicoes,
+                quantidades,
+                f"Retornos por Transição - {nome_sprint}",
+                "Transição",
+                "Quantidade",
+                altura=500,
             )
-
-            return fig
         except Exception as e:
             logger.error(f"Erro ao gerar gráfico de retornos: {str(e)}")
             return go.Figure()
@@ -1841,92 +2497,22 @@ class ReportGenerator:
         # Formatar valores para exibição
         percentual_concluido = round(insights["percentual_concluido"], 1)
 
-        cards_html = f"""
-        <style>
-            .card-container {{
-                display: flex;
-                flex-wrap: wrap;
-                gap: 15px;
-                justify-content: space-between;
-                margin-bottom: 20px;
-            }}
-            .card {{
-                background-color: #f9f9f9;
-                border-radius: 8px;
-                padding: 20px;
-                box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-                flex: 1;
-                min-width: 200px;
-            }}
-            .metric {{
-                font-size: 28px;
-                font-weight: bold;
-                color: #0078d4;
-                margin-bottom: 8px;
-            }}
-            .metric-label {{
-                font-size: 14px;
-                color: #666;
-            }}
-            .progress-container {{
-                width: 100%;
-                height: 8px;
-                background-color: #f1f1f1;
-                border-radius: 4px;
-                margin-top: 10px;
-                overflow: hidden;
-            }}
-            .progress-bar {{
-                height: 100%;
-                background-color: #4CAF50;
-                border-radius: 4px;
-            }}
-        </style>
-        <div class="card-container">
-            <div class="card">
-                <div class="metric">{insights["total_itens"]}</div>
-                <div class="metric-label">Total de Itens de Trabalho</div>
-            </div>
-            <div class="card">
-                <div class="metric">{insights["esforco_total"]}</div>
-                <div class="metric-label">Pontos de Esforço Total</div>
-            </div>
-            <div class="card">
-                <div class="metric">{percentual_concluido}%</div>
-                <div class="metric-label">Taxa de Conclusão</div>
-                <div class="progress-container">
-                    <div class="progress-bar" style="width: {percentual_concluido}%;"></div>
-                </div>
-            </div>
-            <div class="card">
-                <div class="metric">{insights["adicoes_meio_sprint"]}</div>
-                <div class="metric-label">Itens Adicionados no Meio da Sprint</div>
-            </div>
-        </div>
-        """
+        cards_html = _CARDS_CSS + _TEMPLATE_CARDS_METRICAS.substitute(
+            total_itens=insights["total_itens"],
+            esforco_total=insights["esforco_total"],
+            percentual_concluido=percentual_concluido,
+            adicoes_meio_sprint=insights["adicoes_meio_sprint"],
+        )
 
         # Adiciona card de análise de chamados se disponível
         if "total_chamados" in insights and insights["total_chamados"] > 0:
             percentual_chamados = round(
                 insights.get("percentual_chamados_concluidos", 0), 1
             )
-            chamados_html = f"""
-            <div class="card-container">
-                <div class="card" style="width: 100%;">
-                    <div style="display: flex; justify-content: space-between; align-items: center;">
-                        <div style="font-weight: bold; font-size: 16px;">Análise de Chamados</div>
-                        <div style="display: flex; gap: 20px;">
-                            <span>Total: {insights.get("total_chamados", 0)}</span>
-                            <span>Concluídos: {insights.get("chamados_concluidos", 0)}</span>
-                            <span>Taxa: {percentual_chamados}%</span>
-                        </div>
-                    </div>
-                    <div class="progress-container" style="margin-top: 15px;">
-                        <div class="progress-bar" style="width: {percentual_chamados}%;"></div>
-                    </div>
-                </div>
-            </div>
-            """
-            cards_html += chamados_html
+            cards_html += _TEMPLATE_CARD_CHAMADOS.substitute(
+                total_chamados=insights["total_chamados"],
+                chamados_concluidos=insights.get("chamados_concluidos", 0),
+                percentual_chamados=percentual_chamados,
+            )
 
         return cards_html
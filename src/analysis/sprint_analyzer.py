@@ -1,5 +1,6 @@
 import pandas as pd
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 import json
@@ -111,9 +112,18 @@ class SprintAnalyzer:
         # Dados brutos consolidados
         df_consolidado = None
 
-        # Analisa cada sprint individualmente
-        for nome_sprint in nomes_sprints:
-            insights, pasta_sprint = self.analisar_sprint(nome_sprint)
+        # Analisa as sprints em paralelo: cada análise é dominada pelas
+        # chamadas REST ao Azure DevOps, então threads sobrepõem a
+        # latência de rede (cada sprint escreve apenas na própria
+        # pasta). executor.map preserva a ordem de nomes_sprints
+        with ThreadPoolExecutor(
+            max_workers=min(4, len(nomes_sprints))
+        ) as executor:
+            resultados = list(executor.map(self.analisar_sprint, nomes_sprints))
+
+        # Consolida os resultados sequencialmente (cópia de gráficos e
+        # concatenação de CSVs disputariam o mesmo destino em paralelo)
+        for nome_sprint, (insights, pasta_sprint) in zip(nomes_sprints, resultados):
             todos_insights.append(insights)
 
             # Copia os gráficos gerados para a pasta consolidada
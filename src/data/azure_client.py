@@ -1,7 +1,10 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import base64
 import logging
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -36,6 +39,26 @@ class AzureDevOpsClient:
         # URL base para chamadas de API
         self.url_base = f"https://dev.azure.com/{organizacao}/{projeto}"
 
+        # Sessão HTTP persistente: reaproveita conexões TLS entre as
+        # chamadas (keep-alive) em vez de refazer o handshake a cada
+        # requisição, com retry automático para erros transitórios
+        self._sessao = requests.Session()
+        self._sessao.headers.update(self.cabecalho_autenticacao)
+        adaptador = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=[429, 502, 503, 504],
+            ),
+        )
+        self._sessao.mount("https://", adaptador)
+
+    def close(self):
+        """Encerra a sessão HTTP e libera as conexões do pool."""
+        self._sessao.close()
+
     def get_sprints(self):
         """
         Obtém todas as sprints disponíveis para a equipe atual.
@@ -56,7 +79,7 @@ class AzureDevOpsClient:
         logger.info(f"Obtendo sprints de: {url}")
 
         try:
-            resposta = requests.get(url, headers=self.cabecalho_autenticacao)
+            resposta = self._sessao.get(url)
             resposta.raise_for_status()
 
             json_resposta = resposta.json()
@@ -110,7 +133,7 @@ class AzureDevOpsClient:
 
         logger.info(f"Obtendo itens de trabalho da sprint {sprint_id}")
 
-        resposta = requests.get(url, headers=self.cabecalho_autenticacao)
+        resposta = self._sessao.get(url)
         resposta.raise_for_status()
 
         itens_trabalho = resposta.json()["workItemRelations"]
@@ -121,6 +144,66 @@ class AzureDevOpsClient:
         logger.info(f"Encontrados {len(ids_itens_trabalho)} itens de trabalho")
         return ids_itens_trabalho
 
+    def get_work_items_details_batch(self, ids_itens, tamanho_lote=200):
+        """
+        Obtém detalhes de vários itens de trabalho em chamadas em lote.
+
+        A API do Azure DevOps aceita até 200 IDs por chamada, reduzindo
+        N requisições individuais a ceil(N/200).
+
+        Parameters
+        ----------
+        ids_itens : list
+            IDs dos itens de trabalho
+        tamanho_lote : int, optional
+            Quantidade máxima de IDs por chamada (limite da API: 200)
+
+        Returns
+        -------
+        list
+            Lista de itens de trabalho detalhados, sem revisões
+        """
+        itens = []
+
+        for inicio in range(0, len(ids_itens), tamanho_lote):
+            lote = ids_itens[inicio : inicio + tamanho_lote]
+            ids_param = ",".join(str(id_item) for id_item in lote)
+            url = f"{self.url_base}/_apis/wit/workitems?ids={ids_param}&$expand=all&api-version=7.0"
+
+            logger.info(f"Obtendo detalhes de {len(lote)} itens em lote")
+
+            resposta = self._sessao.get(url)
+            resposta.raise_for_status()
+
+            itens.extend(resposta.json()["value"])
+
+        return itens
+
+    def get_work_item_revisions(self, item_id):
+        """
+        Obtém o histórico de revisões de um item de trabalho.
+
+        Parameters
+        ----------
+        item_id : int
+            ID do item de trabalho
+
+        Returns
+        -------
+        list
+            Lista de revisões do item
+        """
+        url_revisoes = (
+            f"{self.url_base}/_apis/wit/workitems/{item_id}/revisions?api-version=7.0"
+        )
+
+        logger.info(f"Obtendo revisões do item {item_id}")
+
+        resposta_revisoes = self._sessao.get(url_revisoes)
+        resposta_revisoes.raise_for_status()
+
+        return resposta_revisoes.json()["value"]
+
     def get_work_item_details(self, item_id):
         """
         Obtém informações detalhadas de um item de trabalho, incluindo revisões.
@@ -142,27 +225,13 @@ class AzureDevOpsClient:
 
         logger.info(f"Obtendo detalhes do item {item_id}")
 
-        resposta = requests.get(url, headers=self.cabecalho_autenticacao)
+        resposta = self._sessao.get(url)
         resposta.raise_for_status()
 
         item_trabalho = resposta.json()
 
-        # Obtém o histórico de revisões
-        url_revisoes = (
-            f"{self.url_base}/_apis/wit/workitems/{item_id}/revisions?api-version=7.0"
-        )
-
-        logger.info(f"Obtendo revisões do item {item_id}")
-
-        resposta_revisoes = requests.get(
-            url_revisoes, headers=self.cabecalho_autenticacao
-        )
-        resposta_revisoes.raise_for_status()
-
-        revisoes = resposta_revisoes.json()["value"]
-
-        # Combina as informações
-        item_trabalho["revisoes"] = revisoes
+        # Combina as informações com o histórico de revisões
+        item_trabalho["revisoes"] = self.get_work_item_revisions(item_id)
 
         return item_trabalho
 
@@ -210,12 +279,18 @@ class AzureDevOpsClient:
             f"Encontrados {len(ids_itens_trabalho)} itens de trabalho na sprint"
         )
 
-        # Obtém detalhes de cada item
-        dados_itens_trabalho = []
-        for id_item in ids_itens_trabalho:
-            logger.info(f"Processando item de trabalho {id_item}")
-            item_trabalho = self.get_work_item_details(id_item)
-            dados_itens_trabalho.append(item_trabalho)
+        # Obtém os detalhes de todos os itens em chamadas em lote e as
+        # revisões (uma chamada por item) em paralelo: o tempo total é
+        # dominado por latência de rede, não por CPU
+        dados_itens_trabalho = self.get_work_items_details_batch(ids_itens_trabalho)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            revisoes_por_item = executor.map(
+                self.get_work_item_revisions,
+                [item["id"] for item in dados_itens_trabalho],
+            )
+            for item_trabalho, revisoes in zip(dados_itens_trabalho, revisoes_por_item):
+                item_trabalho["revisoes"] = revisoes
 
         # Salva os dados brutos
         with open(pasta_saida / "dados_brutos.json", "w") as f:
@@ -1,5 +1,12 @@
 import streamlit as st
-import base64
+
+# pybase64 é API-compatível com o base64 da stdlib e usa SIMD; faz
+# diferença ao codificar relatórios de vários MB para o link de download
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+import mmap
 import os
 
 
@@ -18,10 +25,10 @@ def render_sidebar():
     """
     Renderiza a sidebar com configurações e informações.
 
-    Returns
-    -------
-    dict
-        Dicionário com credenciais fornecidas
+    As credenciais ficam disponíveis diretamente em ``st.session_state``
+    ("org", "project", "team", "pat") via os ``key=`` dos widgets, que
+    são a única fonte de verdade — nenhum dicionário é reconstruído
+    por rerun.
     """
     with st.sidebar:
         st.header("Configurações")
@@ -29,17 +36,15 @@ def render_sidebar():
             "Insira as credenciais do Azure DevOps para acessar os dados da sprint."
         )
 
-        org = st.text_input(
+        st.text_input(
             "Organização", key="org", help="Nome da sua organização no Azure DevOps"
         )
 
-        project = st.text_input(
-            "Projeto", key="project", help="Nome do projeto no Azure DevOps"
-        )
+        st.text_input("Projeto", key="project", help="Nome do projeto no Azure DevOps")
 
-        team = st.text_input("Equipe", key="team", help="Nome da equipe (opcional)")
+        st.text_input("Equipe", key="team", help="Nome da equipe (opcional)")
 
-        pat = st.text_input(
+        st.text_input(
             "Personal Access Token (PAT)",
             type="password",
             key="pat",
@@ -51,15 +56,13 @@ def render_sidebar():
         st.info(
             """
             Esta ferramenta analisa dados de sprints do Azure DevOps.
-            
+
             Desenvolvida para facilitar o acesso a métricas importantes.
-            
+
             💙 BU Payments | v1.0
             """
         )
 
-        return {"org": org, "project": project, "team": team, "pat": pat}
-
 
 def get_download_link(file_path, link_text):
     """
@@ -77,10 +80,11 @@ def get_download_link(file_path, link_text):
     str
         HTML do link de download
     """
+    # mmap evita copiar o arquivo inteiro para a memória antes do
+    # encode; b64encode lê direto das páginas mapeadas
     with open(file_path, "rb") as f:
-        data = f.read()
-
-    b64 = base64.b64encode(data).decode()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as dados:
+            b64 = base64.b64encode(dados).decode("ascii")
     href = f'<a href="data:text/html;base64,{b64}" download="{os.path.basename(file_path)}" target="_blank">{link_text}</a>'
 
     return href
@@ -156,7 +156,9 @@ def render_sprint_analysis_page(
                         analyzer.analisar_multiplas_sprints(selected_sprints)
                     )
                     relatorio_path = report_generator.gerar_relatorio_consolidado(
-                        selected_sprints, pasta_saida
+                        selected_sprints,
+                        pasta_saida,
+                        insights_consolidados=insights_consolidados,
                     )
 
                     # Ler o relatório HTML
@@ -1076,9 +1078,15 @@ def obter_dados_unificados(selected_sprints, analyzer, dados_processados=None):
     pandas.DataFrame
         DataFrame unificado com dados de todas as sprints selecionadas
     """
-    # Verificar se já temos os dados na sessão para evitar busca duplicada
-    if "df_items_unificado" in st.session_state:
-        return st.session_state.df_items_unificado
+    # Verificar se já temos os dados na sessão para evitar busca duplicada.
+    # A chave inclui as sprints selecionadas, então um novo conjunto nunca
+    # reaproveita dados antigos e nenhuma invalidação externa é necessária.
+    nomes_sprints = (
+        selected_sprints if isinstance(selected_sprints, list) else [selected_sprints]
+    )
+    chave_cache = "df_items_unificado_" + "_".join(sorted(nomes_sprints))
+    if chave_cache in st.session_state:
+        return st.session_state[chave_cache]
 
     is_consolidado = isinstance(selected_sprints, list) and len(selected_sprints) > 1
 
@@ -1108,7 +1116,7 @@ def obter_dados_unificados(selected_sprints, analyzer, dados_processados=None):
                 df_items["Categoria"] = "Não categorizado"
 
             # Armazenar na sessão para reutilização
-            st.session_state.df_items_unificado = df_items
+            st.session_state[chave_cache] = df_items
             return df_items
         else:
             return None
@@ -1131,7 +1139,7 @@ def obter_dados_unificados(selected_sprints, analyzer, dados_processados=None):
                 df_items["Categoria"] = "Não categorizado"
 
             # Armazenar na sessão para reutilização
-            st.session_state.df_items_unificado = df_items
+            st.session_state[chave_cache] = df_items
             return df_items
         except Exception as e:
             st.error(f"Erro ao analisar sprint: {str(e)}")